@@ -200,24 +200,22 @@ class AlignmentProcessor:
         backup_dir = self._create_backup_directory(all_files[0])  # Use first file's directory
 
         repaired_files = {}
+        total = len(files_to_repair)
 
-        for i, file_path in enumerate(files_to_repair):
-            if progress_callback:
-                progress_callback(i, len(files_to_repair),
-                                  f"Repairing corrupted files... ({i + 1}/{len(files_to_repair)})")
-
-            corruption_info = corruption_results[file_path]
-
-            try:
-                # Attempt repair with strategy selection
-                repair_result = self.file_repairer.repair_file(
-                    file_path,
-                    corruption_info.corruption_type,
-                    backup_dir,
-                    force_strategy=force_strategy,
-                    selected_strategy=selected_strategy
-                )
+        if progress_callback:
+            progress_callback(0, total, f"Repairing corrupted files... (0/{total})")
+
+        # Files are repaired in parallel and reported in the order they finish
+        items = [(file_path, corruption_results[file_path].corruption_type) for file_path in files_to_repair]
+        repairs = self.file_repairer.repair_files(
+            items,
+            backup_dir,
+            force_strategy=force_strategy,
+            selected_strategy=selected_strategy
+        )
 
+        try:
+            for done, (file_path, repair_result) in enumerate(repairs, 1):
                 # Track repair attempt
                 self.status.repair_attempted += 1
                 self.status.repair_results[file_path] = repair_result
@@ -236,16 +234,13 @@ class AlignmentProcessor:
                     self.status.repair_failed += 1
                     logger.warning(f"❌ Failed to repair {os.path.basename(file_path)}: {repair_result.error_message}")
 
-            except Exception as e:
-                self.status.repair_failed += 1
-                logger.error(f"Exception during repair of {os.path.basename(file_path)}: {e}")
-                self.status.repair_results[file_path] = RepairResult(
-                    strategy_used=selected_strategy if selected_strategy else RepairStrategy.SAFEST,
-                    success=False,
-                    error_message=str(e),
-                    verification_passed=False,
-                    backup_path=""
-                )
+                if progress_callback:
+                    progress_callback(done, total, f"Repairing corrupted files... ({done}/{total})")
+        finally:
+            # Let the workers finish before stopping the ExifTool processes they
+            # use; the repairer's processes are only needed while a batch runs
+            repairs.close()
+            self.file_repairer.close()
 
         if progress_callback:
             progress_callback(len(files_to_repair), len(files_to_repair),
@@ -10,6 +10,16 @@ from .time_calculator import TimeCalculator
 logger = logging.getLogger(__name__)
 
 
+def count_files_in_folder(folder_path: str) -> int:
+    """Count the number of files in a folder, or 0 if it can't be read"""
+    try:
+        # scandir reports the entry type, so regular files need no extra stat
+        with os.scandir(folder_path) as entries:
+            return sum(1 for entry in entries if entry.is_file())
+    except OSError:
+        return 0
+
+
 class AlignmentReport:
     """Generate reports and logs for the alignment operation"""
 
@@ -67,7 +77,7 @@ class AlignmentReport:
         if status.camera_folders:
             report.append(f"Master Folder Organization: {master_folder_org}")
             for camera_id, folder_path in sorted(status.camera_folders.items()):
-                file_count = self._count_files_in_folder(folder_path)
+                file_count = count_files_in_folder(folder_path)
                 report.append(f"- {folder_path}: {file_count} files")
             report.append("")
 
@@ -122,13 +132,6 @@ class AlignmentReport:
             logger.error(f"Error saving log file: {str(e)}")
             return ""
 
-    def _count_files_in_folder(self, folder_path: str) -> int:
-        """Count the number of files in a folder"""
-        try:
-            return len([f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))])
-        except:
-            return 0
-
     def _generate_detailed_log(self, status: ProcessingStatus) -> str:
         """Generate detailed processing log for the file"""
         log = []
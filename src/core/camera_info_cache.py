@@ -0,0 +1,104 @@
+import os
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (make, model) as compared during camera matching
+CameraKey = Tuple[str, str]
+# (st_mtime_ns, st_size) used to detect files changed since they were cached
+FileSignature = Tuple[int, int]
+
+# SQLite limits the number of bound parameters per statement
+LOOKUP_CHUNK_SIZE = 500
+
+# Stored in PRAGMA user_version; bumped when rows written by older versions
+# may be wrong and have to be dropped (see _migrate)
+SCHEMA_VERSION = 1
+
+
+class CameraInfoCache:
+    """
+    Persistent cache of camera make/model per file.
+
+    Rows are keyed by file path and only used while the file's mtime and
+    size still match, so edited files (including our own time offset writes)
+    are read again by ExifTool on the next scan.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        # Scans call in from the worker pool, so share one connection behind a lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS camera_info ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, make TEXT, model TEXT)"
+            )
+            self._migrate()
+        logger.info(f"Camera info cache opened at {self.db_path}")
+
+    def _migrate(self):
+        """Drop rows that older versions may have cached wrongly; the caller must hold self._lock"""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # F4V files used to be read with -fast2, which misses camera tags
+            # stored after the media data
+            self._conn.execute("DELETE FROM camera_info WHERE lower(path) LIKE '%.f4v'")
+        if version < SCHEMA_VERSION:
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def signature(file_path: str) -> Optional[FileSignature]:
+        """Return the (mtime, size) signature of a file, or None if it can't be stat'ed"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def lookup(self, signatures: Dict[str, FileSignature]) -> Dict[str, CameraKey]:
+        """Return cached camera keys for the files whose signature is unchanged"""
+        hits = {}
+        paths = list(signatures)
+        with self._lock:
+            for i in range(0, len(paths), LOOKUP_CHUNK_SIZE):
+                chunk = paths[i:i + LOOKUP_CHUNK_SIZE]
+                rows = self._conn.execute(
+                    "SELECT path, mtime_ns, size, make, model FROM camera_info "
+                    f"WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for path, mtime_ns, size, make, model in rows:
+                    if signatures[path] == (mtime_ns, size):
+                        hits[path] = (make, model)
+        return hits
+
+    def store(self, entries: Iterable[Tuple[str, FileSignature, CameraKey]]):
+        """Insert or refresh the camera keys read for the given files"""
+        rows = [
+            (path, mtime_ns, size, make, model)
+            for path, (mtime_ns, size), (make, model) in entries
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO camera_info (path, mtime_ns, size, make, model) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM camera_info")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
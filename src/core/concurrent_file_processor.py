@@ -2,12 +2,19 @@
 import os
 import asyncio
 import concurrent.futures
-from typing import List, Dict, Callable, Optional, Set
+from itertools import compress
+from operator import itemgetter
+from typing import AsyncIterator, List, Dict, Callable, Optional, Set, Tuple
 from pathlib import Path
 import logging
 
+from .filename_pattern import FilenamePatternMatcher
+
 logger = logging.getLogger(__name__)
 
+# Directory entries handed to the caller per iter_directory step
+SCAN_CHUNK_SIZE = 512
+
 
 class ConcurrentFileProcessor:
     """
@@ -20,29 +27,84 @@ class ConcurrentFileProcessor:
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
     async def scan_directory_async(self, directory: str,
-                                   extensions: Set[str]) -> List[str]:
+                                   extensions: Set[str]) -> List[Tuple[str, str]]:
         """
         Asynchronously scan directory for files with given extensions.
 
         This is much faster than os.listdir for large directories.
+        Returns (basename, full path) tuples so callers that filter on the
+        file name can reuse the name scandir already produced.
+        """
+        results = []
+        async for chunk in self.iter_directory(directory, extensions):
+            results.extend(chunk)
+        return results
+
+    async def iter_directory(self, directory: str, extensions: Set[str],
+                             chunk_size: int = SCAN_CHUNK_SIZE,
+                             signatures: Optional[Dict[str, Tuple[int, int]]] = None
+                             ) -> AsyncIterator[List[Tuple[str, str]]]:
+        """
+        Stream (basename, full path) tuples for files with given extensions.
+
+        The directory is read with os.scandir in the worker pool, chunk_size
+        matches at a time, so callers can start processing before the whole
+        directory has been listed. If a signatures dict is given, it is filled
+        with (st_mtime_ns, st_size) for every yielded path from DirEntry.stat(),
+        which Windows answers from the directory listing without another syscall.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+
+        try:
+            entries = await loop.run_in_executor(self.executor, os.scandir, directory)
+        except Exception as e:
+            logger.error(f"Error scanning directory: {e}")
+            return
 
-        def _scan():
-            results = []
+        # Compared against the text after the last dot, so no '.' + ext per entry
+        suffixes = frozenset(extension[1:] for extension in extensions)
+
+        def _next_chunk():
+            chunk = []
+            append = chunk.append
             try:
-                # Use os.scandir for better performance
-                with os.scandir(directory) as entries:
-                    for entry in entries:
-                        if entry.is_file():
-                            ext = os.path.splitext(entry.name)[1].lower()
-                            if ext in extensions:
-                                results.append(entry.path)
+                for entry in entries:
+                    name = entry.name
+                    # Same result as os.path.splitext (leading dots don't start an
+                    # extension) without its per-call overhead
+                    head, dot, ext = name.rpartition('.')
+                    if not dot or not head.lstrip('.'):
+                        continue
+                    if ext.lower() not in suffixes:
+                        continue
+                    # is_file() answers from the directory listing except for symlinks
+                    # and unknown entry types; a failing stat skips just that entry
+                    # instead of ending the scan with an empty chunk
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    path = entry.path
+                    append((name, path))
+                    if signatures is not None:
+                        try:
+                            stat = entry.stat()
+                            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+                        except OSError:
+                            pass
+                    if len(chunk) >= chunk_size:
+                        break
             except Exception as e:
                 logger.error(f"Error scanning directory: {e}")
-            return results
+            return chunk
 
-        return await loop.run_in_executor(self.executor, _scan)
+        with entries:
+            while True:
+                chunk = await loop.run_in_executor(self.executor, _next_chunk)
+                if not chunk:
+                    return
+                yield chunk
 
     async def filter_files_by_criteria_async(
             self,
@@ -57,6 +119,18 @@ class ConcurrentFileProcessor:
         if not files:
             return []
 
+        # Pattern check first (faster): compile it once and filter the whole list
+        # in C with map/compress, so only camera checks need per-file tasks
+        if pattern:
+            match = FilenamePatternMatcher.compile(pattern).match
+            stems = map(itemgetter(0), map(os.path.splitext, map(os.path.basename, files)))
+            files = list(compress(files, map(match, stems)))
+
+        if camera_info is None:
+            if progress_callback:
+                progress_callback(len(files), len(files))
+            return files
+
         # Process files in chunks for better performance
         chunk_size = 50
         matching_files = []
@@ -67,7 +141,7 @@ class ConcurrentFileProcessor:
             # Process chunk asynchronously
             tasks = []
             for file_path in chunk:
-                task = self._check_file_criteria(file_path, camera_info, pattern)
+                task = self._check_file_criteria(file_path, camera_info)
                 tasks.append(task)
 
             # Wait for chunk results
@@ -87,33 +161,23 @@ class ConcurrentFileProcessor:
     async def _check_file_criteria(
             self,
             file_path: str,
-            camera_info: Optional[Dict[str, str]],
-            pattern: Optional[Dict]
+            camera_info: Dict[str, str]
     ) -> bool:
-        """Check if a file matches the given criteria"""
-        loop = asyncio.get_event_loop()
+        """Check if a file matches the given camera info"""
+        loop = asyncio.get_running_loop()
 
         def _check():
             try:
-                # Check pattern first (faster)
-                if pattern:
-                    from .filename_pattern import FilenamePatternMatcher
-                    filename = os.path.basename(file_path)
-                    if not FilenamePatternMatcher.matches_pattern(filename, pattern):
-                        return False
-
-                # Check camera info if needed
-                if camera_info is not None:
-                    file_camera = self.exif_handler.get_camera_info(file_path)
+                file_camera = self.exif_handler.get_camera_info(file_path)
 
-                    # Handle empty camera info matching
-                    if not camera_info.get('make') and not camera_info.get('model'):
-                        if file_camera.get('make') or file_camera.get('model'):
-                            return False
-                    else:
-                        if (file_camera.get('make') != camera_info.get('make') or
-                                file_camera.get('model') != camera_info.get('model')):
-                            return False
+                # Handle empty camera info matching
+                if not camera_info.get('make') and not camera_info.get('model'):
+                    if file_camera.get('make') or file_camera.get('model'):
+                        return False
+                else:
+                    if (file_camera.get('make') != camera_info.get('make') or
+                            file_camera.get('model') != camera_info.get('model')):
+                        return False
 
                 return True
 
@@ -121,4 +185,8 @@ class ConcurrentFileProcessor:
                 logger.debug(f"Error checking file {file_path}: {e}")
                 return False
 
-        return await loop.run_in_executor(self.executor, _check)
\ No newline at end of file
+        return await loop.run_in_executor(self.executor, _check)
+
+    def shutdown(self):
+        """Release the worker threads"""
+        self.executor.shutdown(wait=False)
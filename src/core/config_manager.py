@@ -3,6 +3,9 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 
+# Default performance.batch_size saved by releases that never read the setting
+LEGACY_DEFAULT_BATCH_SIZE = 20
+
 
 class ConfigManager:
     """Manages application configuration and preferences"""
@@ -28,7 +31,7 @@ class ConfigManager:
                 'exiftool_pool_size': 3,
                 'cache_enabled': True,
                 'cache_size_mb': 100,
-                'batch_size': 20,
+                'batch_size': 200,
                 'max_concurrent_operations': 4
             }
         }
@@ -41,11 +44,20 @@ class ConfigManager:
                     config = json.load(f)
                     # Merge with defaults to ensure all keys exist
                     default = self._default_config()
-                    return self._deep_merge(default, config)
+                    return self._deep_merge(default, self._migrate(config))
             except (json.JSONDecodeError, IOError):
                 return self._default_config()
         return self._default_config()
 
+    def _migrate(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace values saved under old defaults with the current defaults"""
+        performance = config.get('performance')
+        # batch_size used to be written out but ignored, so a saved 20 is the
+        # old default rather than a user choice
+        if isinstance(performance, dict) and performance.get('batch_size') == LEGACY_DEFAULT_BATCH_SIZE:
+            performance['batch_size'] = self._default_config()['performance']['batch_size']
+        return config
+
     def _deep_merge(self, default: Dict, override: Dict) -> Dict:
         """Deep merge override into default"""
         result = default.copy()
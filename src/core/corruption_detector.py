@@ -1,13 +1,14 @@
 # Detect and classify file corruption
 
 import os
-import tempfile
 import subprocess
 import logging
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+from .exiftool_process import ExifToolProcess, json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +34,20 @@ class CorruptionDetector:
 
     def __init__(self, exiftool_path: str = "exiftool"):
         self.exiftool_path = exiftool_path
+        self._exiftool = None
+
+    def _get_exiftool(self) -> ExifToolProcess:
+        """Persistent ExifTool process for metadata reads, started on first use"""
+        if self._exiftool is None:
+            self._exiftool = ExifToolProcess(self.exiftool_path)
+            self._exiftool.start()
+        return self._exiftool
+
+    def close(self):
+        """Stop the persistent ExifTool process, if one was started"""
+        if self._exiftool is not None:
+            self._exiftool.stop()
+            self._exiftool = None
 
     def scan_files_for_corruption(self, file_paths: List[str]) -> Dict[str, CorruptionInfo]:
         """Scan multiple files for corruption and classify them"""
@@ -40,25 +55,29 @@ class CorruptionDetector:
 
         logger.info(f"Scanning {len(file_paths)} files for corruption...")
 
-        for file_path in file_paths:
-            try:
-                corruption_info = self._detect_single_file_corruption(file_path)
-                results[file_path] = corruption_info
-
-                if corruption_info.corruption_type != CorruptionType.HEALTHY:
-                    logger.debug(
-                        f"Corruption detected in {os.path.basename(file_path)}: {corruption_info.corruption_type.value}")
-
-            except Exception as e:
-                logger.error(f"Error scanning {os.path.basename(file_path)}: {e}")
-                # Default to severe corruption if we can't even scan it
-                results[file_path] = CorruptionInfo(
-                    file_path=file_path,
-                    corruption_type=CorruptionType.SEVERE_CORRUPTION,
-                    error_message=f"Scanning error: {str(e)}",
-                    is_repairable=False,
-                    estimated_success_rate=0.0
-                )
+        try:
+            for file_path in file_paths:
+                try:
+                    corruption_info = self._detect_single_file_corruption(file_path)
+                    results[file_path] = corruption_info
+
+                    if corruption_info.corruption_type != CorruptionType.HEALTHY:
+                        logger.debug(
+                            f"Corruption detected in {os.path.basename(file_path)}: {corruption_info.corruption_type.value}")
+
+                except Exception as e:
+                    logger.error(f"Error scanning {os.path.basename(file_path)}: {e}")
+                    # Default to severe corruption if we can't even scan it
+                    results[file_path] = CorruptionInfo(
+                        file_path=file_path,
+                        corruption_type=CorruptionType.SEVERE_CORRUPTION,
+                        error_message=f"Scanning error: {str(e)}",
+                        is_repairable=False,
+                        estimated_success_rate=0.0
+                    )
+        finally:
+            # Don't leave the reader process behind between scans
+            self.close()
 
         return results
 
@@ -98,24 +117,23 @@ class CorruptionDetector:
 
     def _test_basic_metadata_read(self, file_path: str) -> Tuple[bool, str]:
         """Test if we can read basic metadata from file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-            arg_file.write(file_path + '\n')
-            arg_file_path = arg_file.name
-
         try:
-            cmd = [self.exiftool_path, '-json', '-charset', 'filename=utf8', '-@', arg_file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # The persistent process saves a Perl startup per file; its stdin is
+            # already a UTF-8 argument file, so the path is passed inline
+            output = self._get_exiftool().execute_command_raw(
+                ['-json', '-charset', 'filename=utf8', file_path], timeout=30.0
+            )
+            if not output:
+                return False, "No metadata readable"
 
-            if result.returncode == 0 and result.stdout.strip():
-                return True, ""
-            else:
-                return False, result.stderr or "No metadata readable"
+            # Unreadable files come back with an Error entry instead of a failing exit code
+            metadata = json_loads(output)[0]
+            if 'Error' in metadata:
+                return False, metadata['Error']
+            return True, ""
 
         except Exception as e:
             return False, str(e)
-        finally:
-            if os.path.exists(arg_file_path):
-                os.remove(arg_file_path)
 
     def _test_datetime_update(self, file_path: str) -> Tuple[bool, str]:
         """Test if we can update datetime fields (most sensitive corruption test)"""
@@ -126,31 +144,26 @@ class CorruptionDetector:
             import shutil
             shutil.copy2(file_path, backup_path)
 
-            # Try a simple datetime update
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-                arg_file.write(file_path + '\n')
-                arg_file_path = arg_file.name
-
-            try:
-                cmd = [
-                    self.exiftool_path,
-                    '-overwrite_original',
-                    '-ignoreMinorErrors',
-                    '-m',
-                    '-CreateDate=2020:01:01 12:00:00',
-                    '-@', arg_file_path
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                success = "1 image files updated" in result.stdout or "1 files updated" in result.stdout
-                error_msg = result.stderr if result.stderr else result.stdout
-
-                return success, error_msg
-
-            finally:
-                if os.path.exists(arg_file_path):
-                    os.remove(arg_file_path)
+            # Try a simple datetime update; the path goes in through stdin as the
+            # argument file (-@ -), so no temporary file is needed
+            cmd = [
+                self.exiftool_path,
+                '-overwrite_original',
+                '-ignoreMinorErrors',
+                '-m',
+                '-CreateDate=2020:01:01 12:00:00',
+                '-@', '-'
+            ]
+
+            result = subprocess.run(cmd, input=(file_path + '\n').encode('utf-8'),
+                                    capture_output=True, timeout=30)
+            stdout = result.stdout.decode('utf-8', errors='replace')
+            stderr = result.stderr.decode('utf-8', errors='replace')
+
+            success = "1 image files updated" in stdout or "1 files updated" in stdout
+            error_msg = stderr if stderr else stdout
+
+            return success, error_msg
 
         except Exception as e:
             return False, str(e)
@@ -1,14 +1,16 @@
 import shutil
 from .exiftool_pool import ExifToolProcessPool
+from .exiftool_process import CAMERA_TAG_ARGS, SAFE_CAMERA_TAG_ARGS
 from .cached_exif_handler import CachedExifHandler
 import json
 import os
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dateutil import parser
 from ..utils.exceptions import ExifToolNotFoundError, ExifToolError
 from .time_calculator import TimeCalculator
+from .supported_formats import FAST2_UNSAFE_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,7 @@ class ExifHandler:
     def read_metadata(self, file_path: str) -> Dict[str, Any]:
         """Read all metadata from a file"""
         try:
-            logger.debug(f"Reading metadata for {file_path}")
+            logger.debug("Reading metadata for %s", file_path)
 
             # Check if we have a single process for single file mode
             if hasattr(self, '_single_process') and self._single_process:
@@ -59,7 +61,7 @@ class ExifHandler:
                 with self.exiftool_pool.get_process() as process:
                     metadata = process.read_metadata(file_path)
 
-            logger.debug(f"Parsed metadata keys: {list(metadata.keys())}")
+            logger.debug("Parsed metadata keys: %s", metadata.keys())
             return metadata
         except Exception as e:
             logger.error(f"Error reading metadata for {file_path}: {str(e)}")
@@ -71,8 +73,8 @@ class ExifHandler:
         datetime_fields = {}
 
         for key, value in metadata.items():
-            if any(date_key in key.lower() for date_key in ['date', 'time']) and value:
-                parsed_date = TimeCalculator.parse_datetime_naive(str(value))
+            if value and TimeCalculator.is_datetime_field(key):
+                parsed_date = TimeCalculator.parse_datetime_cached(str(value))
                 datetime_fields[key] = parsed_date
 
         return datetime_fields
@@ -93,6 +95,16 @@ class ExifHandler:
             logger.error(f"Error updating datetime fields: {str(e)}")
             raise ExifToolError(f"Error updating datetime fields: {str(e)}")
 
+    def update_datetime_fields_batch(self, updates: List[Tuple[str, Dict[str, datetime]]]) -> List[bool]:
+        """Update datetime fields in several files through one pooled process"""
+        try:
+            logger.info(f"Updating datetime fields in {len(updates)} files")
+            with self.exiftool_pool.get_process() as process:
+                return process.update_datetime_fields_batch(updates)
+        except Exception as e:
+            logger.error(f"Error updating datetime fields: {str(e)}")
+            raise ExifToolError(f"Error updating datetime fields: {str(e)}")
+
     def get_camera_info(self, file_path: str) -> Dict[str, str]:
         """Get camera make and model"""
         metadata = self.read_metadata(file_path)
@@ -105,10 +117,27 @@ class ExifHandler:
         """Read metadata from multiple files in parallel"""
         return self.exiftool_pool.read_metadata_batch_parallel(file_paths)
 
+    def read_camera_metadata_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """Read only Make/Model from multiple files, skipping as much of each file as is safe"""
+        fast, safe = [], []
+        for index, file_path in enumerate(file_paths):
+            extension = os.path.splitext(file_path)[1].lower()
+            (safe if extension in FAST2_UNSAFE_EXTENSIONS else fast).append(index)
+
+        results = [{}] * len(file_paths)
+        for tag_args, indices in ((CAMERA_TAG_ARGS, fast), (SAFE_CAMERA_TAG_ARGS, safe)):
+            if indices:
+                metadata_list = self.exiftool_pool.read_metadata_batch_parallel(
+                    [file_paths[i] for i in indices], tag_args=tag_args
+                )
+                for index, metadata in zip(indices, metadata_list):
+                    results[index] = metadata
+        return results
+
     def get_comprehensive_metadata(self, file_path: str) -> str:
         """Get comprehensive metadata from a file using all ExifTool flags"""
         try:
-            logger.debug(f"Getting comprehensive metadata for {file_path}")
+            logger.debug("Getting comprehensive metadata for %s", file_path)
 
             # Check if we have a single process for single file mode
             if hasattr(self, '_single_process') and self._single_process:
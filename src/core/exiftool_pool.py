@@ -3,9 +3,11 @@ import queue
 import threading
 import logging
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import time
 
+from .exiftool_process import METADATA_TAG_ARGS
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,10 +97,8 @@ class ExifToolProcessPool:
 
                 self.processes.clear()
 
-                # Wait a moment for processes to fully terminate
-                time.sleep(0.5)
-
-                # Reinitialize the pool
+                # stop() already waited for the old processes to exit, and each new
+                # process is ready once start() returns from its -ver handshake
                 self._initialize_pool()
 
                 logger.info("ExifTool process pool restart completed successfully")
@@ -114,6 +114,16 @@ class ExifToolProcessPool:
                         break
                 self._initialize_pool()
 
+    def is_healthy(self) -> bool:
+        """Return True if every process in the pool is still running"""
+        with self._lock:
+            if self._shutdown or len(self.processes) < self.pool_size:
+                return False
+            return all(
+                process.running and process.process is not None and process.process.poll() is None
+                for process in self.processes
+            )
+
     def _stop_all_processes(self):
         """Stop all processes in the pool"""
         for process in self.processes:
@@ -140,22 +150,28 @@ class ExifToolProcessPool:
             if process and not self._shutdown:
                 self.available.put(process)
 
-    def read_metadata_batch_parallel(self, file_paths: List[str],
-                                     chunk_size: int = 10) -> List[Dict[str, Any]]:
+    def read_metadata_batch_parallel(self, file_paths: List[str], chunk_size: int = 10,
+                                     tag_args: Sequence[str] = METADATA_TAG_ARGS) -> List[Dict[str, Any]]:
         """
         Read metadata from multiple files in parallel using the process pool.
+
+        The files are split into at most one contiguous shard per pool process,
+        so each ExifTool process gets a single command instead of the threads
+        queueing up for a process per small chunk. chunk_size is the smallest
+        shard worth handing to its own process, and tag_args selects the tags
+        read (see ExifToolProcess.read_metadata_batch).
         """
         if not file_paths:
             return []
 
+        shard_count = max(1, min(self.pool_size, -(-len(file_paths) // chunk_size)))
+        shard_size = -(-len(file_paths) // shard_count)
         results = [{}] * len(file_paths)
-        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
-        threads = []
 
         def process_chunk(chunk_files, start_idx):
             try:
                 with self.get_process() as process:
-                    chunk_results = process.read_metadata_batch(chunk_files)
+                    chunk_results = process.read_metadata_batch(chunk_files, tag_args)
                     for i, result in enumerate(chunk_results):
                         results[start_idx + i] = result
             except Exception as e:
@@ -164,16 +180,18 @@ class ExifToolProcessPool:
                 for i in range(len(chunk_files)):
                     results[start_idx + i] = {}
 
-        # Process chunks in parallel
-        for i, chunk in enumerate(chunks):
-            start_idx = i * chunk_size
+        # Process shards in parallel, the first one on the calling thread
+        threads = []
+        for start_idx in range(shard_size, len(file_paths), shard_size):
             thread = threading.Thread(
                 target=process_chunk,
-                args=(chunk, start_idx)
+                args=(file_paths[start_idx:start_idx + shard_size], start_idx)
             )
             thread.start()
             threads.append(thread)
 
+        process_chunk(file_paths[:shard_size], 0)
+
         # Wait for all threads to complete
         for thread in threads:
             thread.join()
@@ -4,13 +4,32 @@ import logging
 import os
 import json
 import time
+import queue
 import shutil
+import selectors
 import threading
-import tempfile
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+try:
+    # Optional faster parser for the -json replies; its JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Sentinel ExifTool writes to stdout when a -stay_open command has finished
+READY_MARKER = b"{ready}"
+READ_CHUNK_SIZE = 65536
+
+# Tags read by read_metadata_batch: every date/time tag plus the camera
+METADATA_TAG_ARGS = ('-time:all', '-make', '-model')
+# Camera matching only needs make/model. -fast2 also skips MakerNote parsing,
+# but it stops at the mdat atom of QuickTime-based files and the IDAT chunk of
+# PNGs, after which the camera tags may still follow; those get plain -fast
+CAMERA_TAG_ARGS = ('-fast2', '-make', '-model')
+SAFE_CAMERA_TAG_ARGS = ('-fast', '-make', '-model')
+
 
 class ExifToolProcess:
     """
@@ -24,6 +43,11 @@ class ExifToolProcess:
         self.running = False
         self.command_counter = 0
         self._lock = threading.Lock()
+        self._selector = None
+        self._stdout_queue = None
+        self._stop_requested = False
+        # Output read past the end of the current reply (pipelined commands)
+        self._read_buffer = bytearray()
 
         # Register atexit handler as secondary safety net
         # (primary is ExifToolProcessPool._atexit_cleanup)
@@ -49,6 +73,11 @@ class ExifToolProcess:
 
     def start(self):
         """Start the ExifTool process"""
+        with self._lock:
+            self._start_nolock()
+
+    def _start_nolock(self):
+        """Start the ExifTool process; the caller must hold self._lock"""
         if self.running:
             return
 
@@ -58,101 +87,193 @@ class ExifToolProcess:
                 [self.executable_path, "-stay_open", "True", "-@", "-"],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                # Nothing reads ExifTool's warnings here; a pipe would eventually
+                # fill up and block the process mid-command
+                stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
             )
+            self._setup_stdout_reader()
+            self._read_buffer = bytearray()
             self.running = True
+            self._stop_requested = False
             logger.info("ExifTool process started successfully")
 
             # Test the connection
-            test_result = self.execute_command(["-ver"])
+            test_result = self._send_nolock([["-ver"]], 30.0)[0]
             logger.info(f"ExifTool version: {test_result.strip()}")
 
         except Exception as e:
             logger.error(f"Failed to start ExifTool process: {str(e)}")
+            self._stop_nolock()
             raise
 
+    def _setup_stdout_reader(self):
+        """Prepare non-sleeping reads of the stdout pipe.
+
+        POSIX pipes are selectable, so a selector gives an immediate wakeup when
+        ExifTool writes. Windows pipes are not, so a daemon thread does blocking
+        reads and hands the chunks over through a queue instead.
+        """
+        stdout_fd = self.process.stdout.fileno()
+        if os.name == 'nt':
+            self._stdout_queue = queue.Queue()
+            reader = threading.Thread(
+                target=self._pump_stdout,
+                args=(stdout_fd, self._stdout_queue),
+                daemon=True
+            )
+            reader.start()
+        else:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(stdout_fd, selectors.EVENT_READ)
+
+    @staticmethod
+    def _pump_stdout(stdout_fd: int, chunk_queue: queue.Queue):
+        """Forward raw stdout chunks to the queue until EOF (Windows only)"""
+        while True:
+            try:
+                chunk = os.read(stdout_fd, READ_CHUNK_SIZE)
+            except OSError:
+                chunk = b""
+            chunk_queue.put(chunk)
+            if not chunk:
+                return
+
+    def _read_chunk(self, timeout: float) -> Optional[bytes]:
+        """Read whatever stdout has available, waiting at most `timeout` seconds.
+
+        Returns None if nothing arrived before the timeout and b"" on EOF.
+        """
+        if self._stdout_queue is not None:
+            try:
+                return self._stdout_queue.get(timeout=timeout)
+            except queue.Empty:
+                return None
+
+        if not self._selector.select(timeout):
+            return None
+        return os.read(self.process.stdout.fileno(), READ_CHUNK_SIZE)
+
+    def _read_until_ready(self, timeout: float, decode: bool = True) -> Union[str, bytes]:
+        """Collect stdout until the next {ready} marker or the deadline passes.
+
+        Anything read past the marker belongs to the next pipelined reply and
+        stays in the read buffer. With decode=False the reply is returned as
+        bytes, for callers that hand it straight to the JSON parser.
+        """
+        buffer = self._read_buffer
+        deadline = time.monotonic() + timeout
+        search_start = 0
+
+        while True:
+            marker_index = buffer.find(READY_MARKER, search_start)
+            if marker_index != -1:
+                reply = bytes(buffer[:marker_index])
+                if decode:
+                    reply = reply.decode('utf-8', errors='replace')
+                reply = reply.strip()
+                del buffer[:marker_index + len(READY_MARKER)]
+                return reply
+            # The marker may straddle two chunks
+            search_start = max(0, len(buffer) - len(READY_MARKER) + 1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Command timed out after {timeout} seconds")
+
+            chunk = self._read_chunk(remaining)
+            if chunk is None:
+                continue
+            if not chunk:
+                raise RuntimeError("ExifTool process died")
+
+            buffer += chunk
+
     def execute_command(self, args: List[str], timeout: float = 30.0) -> str:
         """Execute a command using the persistent process"""
         with self._lock:
-            if not self.running:
-                self.start()
+            return self._execute_nolock([args], timeout)[0]
 
-            self.command_counter += 1
+    def execute_command_raw(self, args: List[str], timeout: float = 30.0) -> bytes:
+        """Execute a command and return its reply as undecoded UTF-8 bytes"""
+        with self._lock:
+            return self._execute_nolock([args], timeout, decode=False)[0]
 
-            # Build command - exactly like the original but for persistent process
-            cmd_parts = args + ["-execute"]
-            cmd_str = "\n".join(cmd_parts) + "\n"
+    def execute_commands(self, commands: List[List[str]], timeout: float = 30.0) -> List[str]:
+        """Execute several commands back to back, returning their replies in order.
 
-            try:
-                # Send command
-                self.process.stdin.write(cmd_str)
-                self.process.stdin.flush()
+        All commands are written before the first reply is read, so ExifTool
+        moves straight on to the next one. Only use this for commands with
+        short replies (such as writes): a reply that fills the stdout pipe
+        while we are still writing would block both sides.
+        """
+        with self._lock:
+            return self._execute_nolock(commands, timeout)
+
+    def _execute_nolock(self, commands: List[List[str]], timeout: float = 30.0,
+                        decode: bool = True) -> List[Union[str, bytes]]:
+        """Execute commands; the caller must hold self._lock"""
+        if not self.running:
+            self._start_nolock()
+
+        try:
+            return self._send_nolock(commands, timeout, decode)
+
+        except Exception as e:
+            logger.error(f"Error executing command: {str(e)}")
+            if not self._stop_requested:
+                self._restart_nolock()
+            raise
+        finally:
+            # stop() gave up waiting for this command and terminated the process; finish the cleanup
+            if self._stop_requested:
+                self._stop_nolock()
+
+    def _send_nolock(self, commands: List[List[str]], timeout: float,
+                     decode: bool = True) -> List[Union[str, bytes]]:
+        """Write commands to the running process and read one reply per command"""
+        self.command_counter += len(commands)
 
-                # Read response
-                output_lines = []
-                start_time = time.time()
-
-                while time.time() - start_time < timeout:
-                    if self.process.poll() is not None:
-                        raise RuntimeError("ExifTool process died")
-
-                    line = self.process.stdout.readline()
-                    if line:
-                        output_lines.append(line)
-                        if "{ready}" in line:
-                            break
-                    else:
-                        time.sleep(0.01)
-                else:
-                    raise TimeoutError(f"Command timed out after {timeout} seconds")
-
-                # Join output and clean up
-                output = "".join(output_lines)
-                output = output.replace("{ready}", "").strip()
-
-                return output
-
-            except Exception as e:
-                logger.error(f"Error executing command: {str(e)}")
-                self.restart()
-                raise
-
-    def read_metadata_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
-        """Read metadata from multiple files using argument file - persistent process version"""
+        # Build command - exactly like the original but for persistent process
+        cmd_str = "".join("\n".join(args) + "\n-execute\n" for args in commands)
+
+        # Send command (UTF-8 to match -charset filename=utf8)
+        self.process.stdin.write(cmd_str.encode('utf-8'))
+        self.process.stdin.flush()
+
+        # Read responses without polling; wakes up as soon as data arrives
+        return [self._read_until_ready(timeout, decode) for _ in commands]
+
+    def read_metadata_batch(self, file_paths: List[str],
+                            tag_args: Sequence[str] = METADATA_TAG_ARGS) -> List[Dict[str, Any]]:
+        """Read metadata from multiple files - persistent process version.
+
+        The stay_open stdin is itself an argument file (-@ -), so the paths are
+        sent inline, one per line, with the same UTF-8 filename handling as a
+        temporary argument file but without creating and deleting one per batch.
+        """
         if not file_paths:
             return []
 
-        # Create temporary argument file - exactly like the original
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-            for file_path in file_paths:
-                arg_file.write(file_path + '\n')
-            arg_file_path = arg_file.name
-
         try:
-            # Use the exact same command structure as the original, but with persistent process
             cmd = [
                 '-json',
                 '-charset', 'filename=utf8',
-                '-time:all',
-                '-make',
-                '-model',
-                '-@', arg_file_path  # Key: Using argument file approach
+                *tag_args,
+                *file_paths
             ]
 
-            logger.debug(f"ExifTool command: {' '.join(cmd)}")
+            logger.debug("ExifTool command: -json %s (%d files)", ' '.join(tag_args), len(file_paths))
 
-            # Execute using persistent process
-            output = self.execute_command(cmd)
+            # Execute using persistent process; JSON parsers take UTF-8 bytes
+            # directly, so the reply is not decoded to str first
+            output = self.execute_command_raw(cmd)
 
-            if not output.strip():
+            if not output:
                 logger.warning("ExifTool returned empty output")
                 return [{}] * len(file_paths)
 
-            # Parse JSON exactly like the original
-            metadata_list = json.loads(output)
+            metadata_list = json_loads(output)
 
             # Ensure we have the right number of results
             if len(metadata_list) != len(file_paths):
@@ -162,15 +283,11 @@ class ExifToolProcess:
 
         except (json.JSONDecodeError, IndexError) as e:
             logger.error(f"Error parsing metadata: {e}")
-            logger.error(f"Output was: {output[:500] if 'output' in locals() else 'No output'}")
+            logger.error(f"Output was: {output[:500].decode('utf-8', errors='replace') if 'output' in locals() else 'No output'}")
             return [{}] * len(file_paths)
         except Exception as e:
             logger.error(f"Error in batch metadata reading: {str(e)}")
             return [{}] * len(file_paths)
-        finally:
-            # Clean up the argument file
-            if os.path.exists(arg_file_path):
-                os.remove(arg_file_path)
 
     def read_metadata(self, file_path: str) -> Dict[str, Any]:
         """Read metadata from a single file"""
@@ -179,59 +296,96 @@ class ExifToolProcess:
 
     def update_datetime_fields(self, file_path: str, fields: Dict[str, Any]) -> bool:
         """Update datetime fields using argument file approach with MakerNotes handling"""
-        # Create temporary argument file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-            arg_file.write(file_path + '\n')
-            arg_file_path = arg_file.name
-
         try:
-            cmd = ['-charset', 'filename=utf8', '-overwrite_original', '-ignoreMinorErrors', '-m']
+            cmd = self._datetime_update_args(file_path, fields, {})
 
-            # DEBUG: Log what fields we're trying to update
-            logger.info(f"Updating fields in {os.path.basename(file_path)}:")
-            for field, value in fields.items():
-                if hasattr(value, 'strftime'):
-                    formatted_value = value.strftime("%Y:%m:%d %H:%M:%S")
-                    cmd.append(f'-{field}={formatted_value}')
-                    logger.info(f"  {field} = {formatted_value}")
+            # DEBUG: Log the full command (minus the file path for brevity)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ExifTool command: %s", ' '.join(cmd[:-1]))
 
-            cmd.extend(['-@', arg_file_path])
+            output = self.execute_command(cmd)
+            return self._update_succeeded(file_path, output)
 
-            # DEBUG: Log the full command (minus file paths for brevity)
-            cmd_str = ' '.join([c for c in cmd if not c.startswith('/')])
-            logger.debug(f"ExifTool command: {cmd_str}")
+        except Exception as e:
+            logger.error(f"Error updating datetime fields for {os.path.basename(file_path)}: {str(e)}")
+            return False
 
-            output = self.execute_command(cmd)
+    def update_datetime_fields_batch(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """Update datetime fields in several files with one pipelined write.
 
-            # DEBUG: Log ExifTool output
-            logger.debug(f"ExifTool output for {os.path.basename(file_path)}: {output}")
+        Each file keeps its own command and success check, exactly as in
+        update_datetime_fields, but the commands are sent together so the
+        process never sits idle waiting for the next file.
+        """
+        if not updates:
+            return []
 
-            if "1 image files updated" in output or "1 files updated" in output:
-                logger.info(f"✅ Successfully updated {os.path.basename(file_path)}")
-                return True
-            elif "0 image files updated" in output:
-                logger.warning(f"❌ Failed to update {os.path.basename(file_path)}: {output}")
-                return False
-            else:
-                logger.warning(f"⚠️ Unexpected update output for {os.path.basename(file_path)}: {output}")
-                return False
+        try:
+            # Files in a batch usually share timestamps, so format each one once
+            formatted = {}
+            commands = [
+                self._datetime_update_args(file_path, fields, formatted)
+                for file_path, fields in updates
+            ]
+            logger.debug("ExifTool batch update of %d files", len(commands))
+
+            outputs = self.execute_commands(commands)
+            return [
+                self._update_succeeded(file_path, output)
+                for (file_path, _), output in zip(updates, outputs)
+            ]
 
         except Exception as e:
-            logger.error(f"Error updating datetime fields for {os.path.basename(file_path)}: {str(e)}")
+            logger.error(f"Error in batch datetime update of {len(updates)} files: {str(e)}")
+            return [False] * len(updates)
+
+    @staticmethod
+    def _datetime_update_args(file_path: str, fields: Dict[str, Any],
+                              formatted: Dict[Any, str]) -> List[str]:
+        """Build the write command for one file, formatting timestamps through `formatted`"""
+        cmd = ['-charset', 'filename=utf8', '-overwrite_original', '-ignoreMinorErrors', '-m']
+
+        # DEBUG: Log what fields we're trying to update
+        logger.info(f"Updating fields in {os.path.basename(file_path)}:")
+        # Usually every field gets the same timestamp, so format each distinct value once
+        for field, value in fields.items():
+            if hasattr(value, 'strftime'):
+                formatted_value = formatted.get(value)
+                if formatted_value is None:
+                    formatted_value = formatted[value] = value.strftime("%Y:%m:%d %H:%M:%S")
+                cmd.append(f'-{field}={formatted_value}')
+                logger.info(f"  {field} = {formatted_value}")
+
+        # The path goes inline: the stay_open stdin is itself the argument file
+        cmd.append(file_path)
+        return cmd
+
+    @staticmethod
+    def _update_succeeded(file_path: str, output: str) -> bool:
+        """Check ExifTool's reply to a single-file write"""
+        # DEBUG: Log ExifTool output
+        logger.debug("ExifTool output for %s: %s", file_path, output)
+
+        if "1 image files updated" in output or "1 files updated" in output:
+            logger.info(f"✅ Successfully updated {os.path.basename(file_path)}")
+            return True
+        elif "0 image files updated" in output:
+            logger.warning(f"❌ Failed to update {os.path.basename(file_path)}: {output}")
+            return False
+        else:
+            logger.warning(f"⚠️ Unexpected update output for {os.path.basename(file_path)}: {output}")
             return False
-        finally:
-            if os.path.exists(arg_file_path):
-                try:
-                    os.remove(arg_file_path)
-                except:
-                    pass
 
     def restart(self):
         """Restart the ExifTool process"""
+        with self._lock:
+            self._restart_nolock()
+
+    def _restart_nolock(self):
+        """Restart the ExifTool process; the caller must hold self._lock"""
         logger.warning("Restarting ExifTool process")
-        self.stop()
-        time.sleep(0.2)
-        self.start()
+        self._stop_nolock()
+        self._start_nolock()
 
     def stop(self):
         """Stop the ExifTool process"""
@@ -239,38 +393,63 @@ class ExifToolProcess:
             return
 
         logger.info("Stopping ExifTool process")
-        with self._lock:
+        # A command may be in flight (e.g. stop() from __del__ or atexit); don't wait on it forever
+        if not self._lock.acquire(timeout=1):
+            logger.warning("ExifTool process busy, terminating it")
+            self._stop_requested = True
+            self._terminate()
+            return
+
+        try:
+            self._stop_nolock()
+        finally:
+            self._lock.release()
+
+    def _stop_nolock(self):
+        """Stop the ExifTool process; the caller must hold self._lock"""
+        if not self.running:
+            return
+
+        try:
+            if self.process and self.process.poll() is None and self.process.stdin:
+                self.process.stdin.write(b"-stay_open\nFalse\n")
+                self.process.stdin.flush()
+            if self.process:
+                try:
+                    self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._terminate()
+        except Exception as e:
+            logger.warning(f"Error while stopping ExifTool: {str(e)}")
             try:
-                if self.process and self.process.stdin:
-                    self.process.stdin.write("-stay_open\nFalse\n")
-                    self.process.stdin.flush()
                 if self.process:
-                    try:
-                        self.process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        self.process.terminate()
-                        try:
-                            self.process.wait(timeout=1)
-                        except subprocess.TimeoutExpired:
-                            self.process.kill()
-            except Exception as e:
-                logger.warning(f"Error while stopping ExifTool: {str(e)}")
-                try:
-                    if self.process:
-                        self.process.kill()
-                except:
-                    pass
-            finally:
-                self.running = False
-                self.process = None
+                    self.process.kill()
+            except:
+                pass
+        finally:
+            if self._selector is not None:
+                self._selector.close()
+            self._selector = None
+            self._stdout_queue = None
+            self.running = False
+            self.process = None
+
+    def _terminate(self):
+        """Terminate the process without touching its pipes, killing it if it doesn't exit"""
+        process = self.process
+        if process is None:
+            return
+        try:
+            process.terminate()
+            try:
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        except OSError:
+            pass
 
     def get_comprehensive_metadata(self, file_path: str) -> str:
         """Get comprehensive metadata using -a -u -g1 flags for a single file"""
-        # Create temporary argument file with single file - exactly like batch operations
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-            arg_file.write(file_path + '\n')
-            arg_file_path = arg_file.name
-
         try:
             # Use the same command structure as batch operations, but with comprehensive flags
             cmd = [
@@ -278,10 +457,10 @@ class ExifToolProcess:
                 '-u',  # Unknown tags
                 '-g1',  # Group by category level 1
                 '-charset', 'filename=utf8',
-                '-@', arg_file_path  # Single-file argument file (same as batch approach)
+                file_path  # Inline, same as batch operations
             ]
 
-            logger.debug(f"ExifTool comprehensive command: {' '.join(cmd)}")
+            logger.debug("ExifTool comprehensive command: %s", ' '.join(cmd))
 
             # Execute using persistent process (same as batch operations)
             output = self.execute_command(cmd)
@@ -295,10 +474,6 @@ class ExifToolProcess:
         except Exception as e:
             logger.error(f"Error getting comprehensive metadata: {str(e)}")
             return f"Error reading metadata: {str(e)}"
-        finally:
-            # Clean up the argument file (same as batch operations)
-            if os.path.exists(arg_file_path):
-                os.remove(arg_file_path)
 
     def _atexit_cleanup(self):
         """
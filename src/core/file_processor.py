@@ -1,35 +1,53 @@
 import os
+import sys
 import asyncio
 import logging
-from typing import List, Dict, Optional, Set
+import threading
+import time
+from itertools import compress, repeat
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from ..utils.exceptions import FileProcessingError
 from .filename_pattern import FilenamePatternMatcher
-from .supported_formats import ALL_SUPPORTED_EXTENSIONS
+from .supported_formats import ALL_SUPPORTED_EXTENSIONS, NO_CAMERA_METADATA_EXTENSIONS
 from .concurrent_file_processor import ConcurrentFileProcessor
+from .camera_info_cache import CameraInfoCache
 from .time_calculator import TimeCalculator
 
 logger = logging.getLogger(__name__)
 
-import os
-import logging
-import gc
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from ..utils.exceptions import FileProcessingError
-from .time_calculator import TimeCalculator
-
-import gc
-from .supported_formats import ALL_SUPPORTED_EXTENSIONS
-from .concurrent_file_processor import ConcurrentFileProcessor
-
-logger = logging.getLogger(__name__)
+# Number of paths sent per files_found signal emission. Camera matches trickle
+# in, so they go out in small chunks; files that need no metadata arrive a whole
+# scan chunk at a time and are sent in larger ones to cut cross-thread signals
+EMIT_BATCH_SIZE = 64
+BULK_EMIT_BATCH_SIZE = 512
+
+# Datetime fields always written when applying an offset, even if the file lacks them.
+# Includes both EXIF metadata fields and filesystem date fields
+MANDATORY_DATETIME_FIELDS = (
+    'DateTimeOriginal', 'CreateDate', 'ModifyDate',  # EXIF metadata fields
+    'FileCreateDate', 'FileModifyDate'  # Filesystem date fields
+)
+
+# Files read per ExifTool metadata call during camera matching; batches start
+# at the initial size and adapt between the minimum and the configured maximum
+CAMERA_MATCH_BATCH_SIZE = 200
+INITIAL_CAMERA_BATCH_SIZE = 64
+MIN_CAMERA_BATCH_SIZE = 16
+MAX_IN_FLIGHT_BATCHES = 3
+FAST_BATCH_SECONDS = 0.25
+SLOW_BATCH_SECONDS = 2.0
 
 class FileProcessor:
     """Handles file scanning and grouping logic with async operations"""
 
-    def __init__(self, exif_handler):
+    def __init__(self, exif_handler, batch_size: int = CAMERA_MATCH_BATCH_SIZE,
+                 camera_cache: Optional[CameraInfoCache] = None):
         self.exif_handler = exif_handler
+        self.batch_size = batch_size
+        self.camera_cache = camera_cache
         self.supported_extensions = ALL_SUPPORTED_EXTENSIONS
         self.concurrent_processor = ConcurrentFileProcessor(exif_handler)
         logger.info(f"FileProcessor initialized with {len(self.supported_extensions)} supported formats")
@@ -38,26 +56,60 @@ class FileProcessor:
         self.GROUP_SIZE = 40
         self.progress_callback = None
 
+        # Event loop shared by all scans, started lazily on a daemon thread
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background scan event loop, starting it on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="FileProcessorEventLoop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def shutdown(self):
+        """Stop the background scan loop and release the worker threads"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=2)
+            if not loop.is_running():
+                loop.close()
+        self.concurrent_processor.shutdown()
+
     def find_matching_files_incremental(self, reference_file: str, use_camera_match: bool = True,
                                         use_extension_match: bool = True, use_pattern_match: bool = False,
-                                        file_found_signal=None) -> None:
-        """Find files incrementally using async operations"""
-        # Run async method in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(
-                self._find_matching_files_async(
-                    reference_file, use_camera_match, use_extension_match,
-                    use_pattern_match, file_found_signal
-                )
-            )
-        finally:
-            loop.close()
+                                        files_found_signal=None) -> None:
+        """Find files incrementally using async operations.
+
+        Matches are reported through files_found_signal in lists of up to
+        EMIT_BATCH_SIZE paths (BULK_EMIT_BATCH_SIZE when no camera check is
+        needed).
+        """
+        # Run on the shared loop thread and block the calling thread until done
+        future = asyncio.run_coroutine_threadsafe(
+            self._find_matching_files_async(
+                reference_file, use_camera_match, use_extension_match,
+                use_pattern_match, files_found_signal
+            ),
+            self._get_event_loop()
+        )
+        future.result()
 
     async def _find_matching_files_async(self, reference_file: str, use_camera_match: bool,
                                          use_extension_match: bool, use_pattern_match: bool,
-                                         file_found_signal) -> None:
+                                         files_found_signal) -> None:
         """Async implementation of find_matching_files"""
         try:
             folder = os.path.dirname(reference_file)
@@ -75,77 +127,233 @@ class FileProcessor:
                 ref_pattern = FilenamePatternMatcher.extract_pattern(ref_filename)
                 logger.info(f"Reference pattern: {ref_pattern['display']}")
 
-            # Get reference camera info
-            ref_camera_info = None
+            # Start reading the reference camera info; the directory scan and the
+            # first metadata batches proceed while it is in flight
+            ref_camera_task = None
             if use_camera_match:
-                ref_camera_info = self.exif_handler.get_camera_info(reference_file)
-                logger.info(f"Reference camera: {ref_camera_info}")
+                ref_camera_task = asyncio.ensure_future(
+                    self._run_blocking(self.exif_handler.get_camera_info, reference_file)
+                )
 
             # Determine extensions to scan
             extensions = {ref_extension} if use_extension_match else self.supported_extensions
 
-            # Fast async directory scan
-            all_files = await self.concurrent_processor.scan_directory_async(folder, extensions)
-
-            logger.info(f"Found {len(all_files)} potential files after extension filtering")
-
-            # Quick pattern filtering if enabled
+            # Stream the directory in chunks so the first matches reach the UI
+            # while the rest of the folder is still being read
+            match = None
             if use_pattern_match and ref_pattern:
-                pattern_filtered = []
-                for file_path in all_files:
-                    if FilenamePatternMatcher.matches_pattern(os.path.basename(file_path), ref_pattern):
-                        pattern_filtered.append(file_path)
-                all_files = pattern_filtered
-                logger.info(f"Pattern filtering reduced to {len(all_files)} files")
-
-            # If no camera matching needed, emit all files
-            if not use_camera_match or not ref_camera_info:
+                match = FilenamePatternMatcher.compile(ref_pattern).match
+
+            counts = {'scanned': 0, 'candidates': 0}
+
+            # The camera cache is validated against mtime/size, which the scan
+            # can provide from its directory entries
+            signatures = {} if use_camera_match and self.camera_cache is not None else None
+
+            async def candidate_batches():
+                async for entries in self.concurrent_processor.iter_directory(
+                        folder, extensions, signatures=signatures):
+                    counts['scanned'] += len(entries)
+                    # Quick pattern filtering using the basenames from the scan. Every
+                    # scanned name has an extension, so rpartition gives the same stem
+                    # as splitext, and the whole filter runs in C without a Python loop
+                    if match:
+                        filenames, paths = zip(*entries)
+                        stems = map(itemgetter(0), map(str.rpartition, filenames, repeat('.')))
+                        files = list(compress(paths, map(match, stems)))
+                    else:
+                        files = [file_path for _, file_path in entries]
+                    counts['candidates'] += len(files)
+                    if files:
+                        yield files
+
+            # If no camera matching needed, emit all files in directory order
+            # (the UI sorts the final list once scanning completes)
+            if ref_camera_task is None:
                 logger.info("No camera matching needed, emitting all files")
-                for file_path in sorted(all_files):
-                    if file_found_signal:
-                        file_found_signal.emit(file_path)
-                return
-
-            # Process files for camera matching in parallel batches
-            await self._process_camera_matching_async(
-                all_files, ref_camera_info, file_found_signal
-            )
+                async for files in candidate_batches():
+                    self._emit_files(files, files_found_signal, BULK_EMIT_BATCH_SIZE)
+            else:
+                # Process files for camera matching in parallel batches
+                await self._process_camera_matching_async(
+                    candidate_batches(), ref_camera_task, files_found_signal, signatures
+                )
+
+            logger.info(f"Found {counts['scanned']} potential files after extension filtering")
+            if match:
+                logger.info(f"Pattern filtering reduced to {counts['candidates']} files")
 
         except Exception as e:
             logger.error(f"Error in find_matching_files: {str(e)}")
             raise FileProcessingError(f"Error scanning files: {str(e)}")
 
-    async def _process_camera_matching_async(self, files: List[str], ref_camera_info: Dict[str, str],
-                                             file_found_signal) -> None:
-        """Process camera matching asynchronously"""
-        # Process in batches for efficiency
-        batch_size = 20
-
+    async def _run_blocking(self, func, *args):
+        """Run a blocking ExifTool call in the worker pool without stalling the shared loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.concurrent_processor.executor, func, *args)
+
+    @staticmethod
+    def _camera_key(make: Optional[str], model: Optional[str]) -> Tuple[str, str]:
+        """Normalised (make, model) pair.
+
+        A folder holds only a handful of distinct cameras, so the strings are
+        interned: every key shares the same few objects and the comparison
+        against the reference key is usually an identity check.
+        """
+        return sys.intern((make or '').strip()), sys.intern((model or '').strip())
+
+    def _read_camera_keys(self, batch: List[str],
+                          known_signatures: Optional[Dict[str, Tuple[int, int]]] = None
+                          ) -> List[Tuple[str, str]]:
+        """Return the (make, model) of each file, using the camera cache when set.
+
+        known_signatures holds (mtime, size) pairs already taken during the
+        scan; files missing from it are stat'ed here.
+        """
+        camera_key = self._camera_key
+        empty_key = camera_key('', '')
+
+        # Formats that cannot carry camera tags need no ExifTool call at all
+        keys = {}
+        to_read = []
+        splitext, add_to_read = os.path.splitext, to_read.append
+        for file_path in batch:
+            if splitext(file_path)[1].lower() in NO_CAMERA_METADATA_EXTENSIONS:
+                keys[file_path] = empty_key
+            else:
+                add_to_read(file_path)
+
+        if to_read and self.camera_cache is None:
+            metadata_list = self.exif_handler.read_camera_metadata_batch(to_read)
+            for file_path, metadata in zip(to_read, metadata_list):
+                keys[file_path] = camera_key(metadata.get('Make'), metadata.get('Model'))
+
+        elif to_read:
+            signatures = {}
+            for file_path in to_read:
+                signature = known_signatures.pop(file_path, None) if known_signatures else None
+                if signature is None:
+                    signature = self.camera_cache.signature(file_path)
+                if signature is not None:
+                    signatures[file_path] = signature
+            for file_path, (make, model) in self.camera_cache.lookup(signatures).items():
+                keys[file_path] = camera_key(make, model)
+
+            # Only files that are new or changed since they were cached go to ExifTool
+            misses = [file_path for file_path in to_read if file_path not in keys]
+            if misses:
+                metadata_list = self.exif_handler.read_camera_metadata_batch(misses)
+                read = []
+                for file_path, metadata in zip(misses, metadata_list):
+                    key = keys[file_path] = camera_key(metadata.get('Make'), metadata.get('Model'))
+                    # An empty dict means the read failed, which is not worth remembering
+                    if metadata and file_path in signatures:
+                        read.append((file_path, signatures[file_path], key))
+                self.camera_cache.store(read)
+                logger.debug("Camera cache: %d hits, %d read", len(to_read) - len(misses), len(misses))
+
+        return [keys.get(file_path, empty_key) for file_path in batch]
+
+    @staticmethod
+    def _emit_files(files: List[str], files_found_signal,
+                    batch_size: int = EMIT_BATCH_SIZE) -> None:
+        """Emit matching files, coalesced into chunks of at most batch_size"""
+        if not files or not files_found_signal:
+            return
         for i in range(0, len(files), batch_size):
-            batch = files[i:i + batch_size]
-
-            # Get metadata for batch in parallel
-            metadata_list = self.exif_handler.read_metadata_batch(batch)
-
-            # Check each file in batch
-            for file_path, metadata in zip(batch, metadata_list):
-                make = metadata.get('Make', '').strip()
-                model = metadata.get('Model', '').strip()
-
-                # Check if camera matches
-                matches = False
-                if not ref_camera_info.get('make') and not ref_camera_info.get('model'):
-                    # Reference has empty camera info - match files with empty camera info
-                    if not make and not model:
-                        matches = True
+            files_found_signal.emit(files[i:i + batch_size])
+
+    async def _process_camera_matching_async(self, file_batches: AsyncIterator[List[str]],
+                                             ref_camera_task: Awaitable[Dict[str, str]],
+                                             files_found_signal,
+                                             signatures: Optional[Dict[str, Tuple[int, int]]] = None
+                                             ) -> None:
+        """Process camera matching asynchronously as scan chunks arrive.
+
+        Several metadata batches are kept in flight against the ExifTool pool,
+        and the batch size adapts to how long each batch takes, up to
+        self.batch_size. The reference camera info is only awaited once the
+        first batch comes back, so its lookup overlaps the scan.
+        """
+        batch_size = min(INITIAL_CAMERA_BATCH_SIZE, self.batch_size)
+        queued = []
+        pending = []
+        in_flight = set()
+
+        ref_key = None
+
+        async def reference_key():
+            nonlocal ref_key
+            if ref_key is None:
+                ref_camera_info = await ref_camera_task or {}
+                logger.info(f"Reference camera: {ref_camera_info}")
+                # A reference without camera info yields ('', ''), which then only
+                # matches files without camera info, so one tuple compare covers both cases
+                ref_key = self._camera_key(ref_camera_info.get('make'), ref_camera_info.get('model'))
+            return ref_key
+
+        async def read_batch(batch: List[str]):
+            started = time.monotonic()
+            # Get camera info for batch in parallel (off the loop so other scans keep running)
+            camera_keys = await self._run_blocking(self._read_camera_keys, batch, signatures)
+            return batch, camera_keys, time.monotonic() - started
+
+        def submit(count: int) -> None:
+            batch = queued[:count]
+            del queued[:count]
+            in_flight.add(asyncio.ensure_future(read_batch(batch)))
+
+        async def collect() -> None:
+            nonlocal pending, batch_size
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            key = await reference_key()
+            for task in done:
+                in_flight.discard(task)
+                batch, camera_keys, elapsed = task.result()
+
+                # Check each file in batch with one tuple compare
+                pending.extend([
+                    file_path for file_path, camera_key in zip(batch, camera_keys)
+                    if camera_key == key
+                ])
+
+                # Quick replies mean the per-call round-trip dominates, so send more
+                # per call; slow ones hold back results from the UI, so send fewer
+                if elapsed < FAST_BATCH_SECONDS:
+                    batch_size = min(batch_size * 2, self.batch_size)
+                elif elapsed > SLOW_BATCH_SECONDS:
+                    batch_size = max(batch_size // 2, MIN_CAMERA_BATCH_SIZE)
+
+            # Flush once enough matches have accumulated
+            if len(pending) >= EMIT_BATCH_SIZE:
+                self._emit_files(pending, files_found_signal)
+                pending = []
+
+        try:
+            async for files in file_batches:
+                queued.extend(files)
+                # Only full batches are sent while the scan is still running
+                while len(queued) >= batch_size:
+                    if len(in_flight) < MAX_IN_FLIGHT_BATCHES:
+                        submit(batch_size)
+                    else:
+                        await collect()
+
+            while queued or in_flight:
+                if queued and len(in_flight) < MAX_IN_FLIGHT_BATCHES:
+                    submit(batch_size)
                 else:
-                    # Reference has camera info - match files with same camera info
-                    if (make == ref_camera_info.get('make', '') and
-                            model == ref_camera_info.get('model', '')):
-                        matches = True
+                    await collect()
+
+            # Surface a failed reference lookup even when no files were found
+            await reference_key()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if not ref_camera_task.done():
+                ref_camera_task.cancel()
 
-                if matches and file_found_signal:
-                    file_found_signal.emit(file_path)
+        self._emit_files(pending, files_found_signal)
 
     def apply_time_offset(self, files: List[str], selected_field: str,
                           offset_seconds: float = 0) -> Dict[str, bool]:
@@ -199,17 +407,12 @@ class FileProcessor:
                     self.progress_callback(processed_files, total_files, "Restarting processes...")
 
                 try:
+                    # Returns once every new process has answered its -ver handshake
                     self.exif_handler.exiftool_pool.restart_pool()
-                    # Small delay to ensure processes are ready
-                    import time
-                    time.sleep(0.2)
                 except Exception as e:
                     logger.error(f"Error restarting process pool: {str(e)}")
                     # Continue anyway - the pool might still work
 
-            # Force garbage collection after each group
-            gc.collect()
-
         # Final progress update
         if self.progress_callback:
             self.progress_callback(total_files, total_files, "Processing complete")
@@ -221,164 +424,258 @@ class FileProcessor:
 
     def _process_group_with_retry(self, group_files: List[str], selected_field: str,
                                   offset_seconds: float, group_num: int, total_groups: int) -> Dict[str, bool]:
-        """Process a group of files with retry logic"""
+        """Process a group of files, retrying only the files that failed for transient reasons"""
         max_attempts = 2
+        results = {}
+        remaining = group_files
 
         for attempt in range(max_attempts):
             attempt_num = attempt + 1
 
-            try:
-                if attempt > 0:
-                    logger.warning(f"Retrying group {group_num}/{total_groups} (attempt {attempt_num}/{max_attempts})")
-                    if self.progress_callback:
-                        status = f"Retrying group {group_num} of {total_groups} (attempt {attempt_num})"
-                        # We don't update the file count during retry, just the status
-                        processed_so_far = (group_num - 1) * self.GROUP_SIZE
-                        total_files = total_groups * self.GROUP_SIZE
-                        self.progress_callback(processed_so_far, total_files, status)
-
-                # Process the group
-                group_results = self._process_single_group(group_files, selected_field, offset_seconds)
-
-                # Check if the group was processed successfully
-                successful_files = sum(1 for success in group_results.values() if success)
-                logger.info(
-                    f"Group {group_num}/{total_groups} attempt {attempt_num}: {successful_files}/{len(group_files)} files successful")
-
-                return group_results
+            if attempt > 0:
+                logger.warning(
+                    f"Retrying {len(remaining)} failed files of group {group_num}/{total_groups} "
+                    f"(attempt {attempt_num}/{max_attempts})")
+                if self.progress_callback:
+                    status = f"Retrying group {group_num} of {total_groups} (attempt {attempt_num})"
+                    # We don't update the file count during retry, just the status
+                    processed_so_far = (group_num - 1) * self.GROUP_SIZE
+                    total_files = total_groups * self.GROUP_SIZE
+                    self.progress_callback(processed_so_far, total_files, status)
 
+            try:
+                attempt_results, transient = self._process_single_group(remaining, selected_field, offset_seconds)
             except Exception as e:
                 logger.error(f"Error processing group {group_num}/{total_groups} attempt {attempt_num}: {str(e)}")
+                attempt_results = {file_path: False for file_path in remaining}
+                transient = set(remaining)
+
+            # Keep what succeeded; only the failures go into the next attempt
+            results.update(attempt_results)
+            failed = [file_path for file_path in remaining if not attempt_results.get(file_path)]
+            logger.info(
+                f"Group {group_num}/{total_groups} attempt {attempt_num}: "
+                f"{len(group_files) - len(failed)}/{len(group_files)} files successful")
+
+            # A file missing the selected field fails the same way every time
+            remaining = [file_path for file_path in failed if file_path in transient]
+            if len(remaining) < len(failed):
+                logger.info(
+                    f"Group {group_num}/{total_groups}: not retrying {len(failed) - len(remaining)} "
+                    f"files that cannot be updated")
 
-                if attempt < max_attempts - 1:
-                    # Not the last attempt, try restarting the pool
+            if not remaining:
+                break
+
+            if attempt < max_attempts - 1:
+                # Each process restarts itself after a failed command, so only
+                # restart the pool if one of them is still down
+                if not self.exif_handler.exiftool_pool.is_healthy():
                     logger.info(f"Restarting process pool before retry...")
                     try:
                         self.exif_handler.exiftool_pool.restart_pool()
-                        import time
-                        time.sleep(0.5)
                     except Exception as restart_error:
                         logger.error(f"Error restarting pool for retry: {str(restart_error)}")
-                else:
-                    # Last attempt failed, return failure for all files in group
-                    logger.error(f"Group {group_num}/{total_groups} failed after {max_attempts} attempts")
-                    return {file_path: False for file_path in group_files}
+            else:
+                logger.error(f"Group {group_num}/{total_groups}: {len(remaining)} files failed after {max_attempts} attempts")
 
-        # Shouldn't reach here, but just in case
-        return {file_path: False for file_path in group_files}
+        # Report in the original file order
+        return {file_path: results.get(file_path, False) for file_path in group_files}
 
     def _process_single_group(self, group_files: List[str], selected_field: str,
-                              offset_seconds: float) -> Dict[str, bool]:
-        """Process a single group of files with batch metadata reading"""
+                              offset_seconds: float) -> Tuple[Dict[str, bool], Set[str]]:
+        """Process a single group of files with batch metadata reading.
+
+        Returns the per-file results and the set of failed files worth
+        retrying: those that failed in ExifTool rather than for lack of
+        the selected field.
+        """
         results = {}
+        transient = set()
 
-        logger.debug(f"Reading metadata for entire group of {len(group_files)} files at once")
+        logger.debug("Reading metadata for entire group of %d files at once", len(group_files))
 
         # Read metadata for ALL files in the group at once (instead of in small batches)
         try:
             metadata_list = self.exif_handler.read_metadata_batch(group_files)
-            logger.debug(f"Successfully read metadata for {len(metadata_list)} files in group")
+            logger.debug("Successfully read metadata for %d files in group", len(metadata_list))
         except Exception as e:
             logger.error(f"Error reading batch metadata for group: {str(e)}")
             # Fallback to individual file processing
             return self._process_group_individual_fallback(group_files, selected_field, offset_seconds)
 
-        # Process each file with its metadata
+        # Work out every file's new timestamps first
+        updates = []
+        mandatory_added = {}
         for file_path, metadata in zip(group_files, metadata_list):
             try:
-                result = self._process_single_file(file_path, metadata, selected_field, offset_seconds)
-                results[file_path] = result
+                update = self._build_update_fields(file_path, metadata, selected_field, offset_seconds)
             except Exception as e:
                 logger.error(f"Error processing {os.path.basename(file_path)}: {str(e)}")
+                update = None
+            if update is None:
                 results[file_path] = False
+            else:
+                fields_to_update, mandatory_added[file_path] = update
+                updates.append((file_path, fields_to_update))
+
+        # Then write them as one pipelined batch per pooled ExifTool process,
+        # so all of them are kept busy
+        if updates:
+            workers = max(1, min(self.exif_handler.exiftool_pool.pool_size, len(updates)))
+            shard_size = -(-len(updates) // workers)
+            shards = [updates[i:i + shard_size] for i in range(0, len(updates), shard_size)]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="TimeOffsetWriter") as executor:
+                for shard, shard_results in zip(shards, executor.map(self._write_updates, shards)):
+                    for (file_path, fields_to_update), success in zip(shard, shard_results):
+                        results[file_path] = success
+                        if success:
+                            self._log_update_success(file_path, fields_to_update, mandatory_added[file_path])
+                        else:
+                            transient.add(file_path)
+
+        return {file_path: results.get(file_path, False) for file_path in group_files}, transient
+
+    def _write_updates(self, updates: List[Tuple[str, Dict[str, datetime]]]) -> List[bool]:
+        """Write a shard of (file_path, fields) updates, failing the whole shard on error"""
+        try:
+            shard_results = self.exif_handler.update_datetime_fields_batch(updates)
+        except Exception as e:
+            logger.error(f"Error writing {len(updates)} files: {str(e)}")
+            return [False] * len(updates)
 
-        return results
+        for (file_path, _), success in zip(updates, shard_results):
+            if not success:
+                logger.warning(f"Failed to update fields in {os.path.basename(file_path)}")
+        return shard_results
 
     def _process_group_individual_fallback(self, group_files: List[str], selected_field: str,
-                                           offset_seconds: float) -> Dict[str, bool]:
+                                           offset_seconds: float) -> Tuple[Dict[str, bool], Set[str]]:
         """Fallback to individual file processing if batch fails"""
         logger.warning("Falling back to individual file processing for this group")
         results = {}
+        transient = set()
 
         for file_path in group_files:
+            filename = os.path.basename(file_path)
             try:
                 # Read metadata for single file
                 metadata = self.exif_handler.read_metadata(file_path)
-                result = self._process_single_file(file_path, metadata, selected_field, offset_seconds)
-                results[file_path] = result
             except Exception as e:
-                logger.error(f"Error processing {os.path.basename(file_path)}: {str(e)}")
+                logger.error(f"Error reading metadata from {filename}: {str(e)}")
                 results[file_path] = False
+                transient.add(file_path)
+                continue
 
-        return results
+            try:
+                update = self._build_update_fields(file_path, metadata, selected_field, offset_seconds)
+            except Exception as e:
+                logger.error(f"Error processing {filename}: {str(e)}")
+                update = None
+            if update is None:
+                results[file_path] = False
+                continue
+
+            results[file_path] = self._write_single_file(file_path, *update)
+            if not results[file_path]:
+                transient.add(file_path)
+
+        return results, transient
 
     def _process_single_file(self, file_path: str, metadata: dict,
                              selected_field: str, offset_seconds: float) -> bool:
         """Process a single file with mandatory timestamp field enforcement"""
         try:
-            # Parse datetime fields from metadata
-            datetime_fields = {}
-            for key, value in metadata.items():
-                if any(date_key in key.lower() for date_key in ['date', 'time']) and value:
-                    parsed_date = TimeCalculator.parse_datetime_naive(str(value))
-                    if parsed_date:
-                        datetime_fields[key] = parsed_date
-
-            # DEBUG: Log what datetime fields were found
-            logger.debug(f"Found datetime fields in {os.path.basename(file_path)}: {list(datetime_fields.keys())}")
-
-            # Check if selected field exists
-            if selected_field not in datetime_fields or datetime_fields[selected_field] is None:
-                logger.warning(f"Selected field {selected_field} not found in {os.path.basename(file_path)}")
-                return False
-
-            # Apply offset to selected field
-            original_timestamp = datetime_fields[selected_field]
-            if offset_seconds != 0:
-                adjusted_timestamp = original_timestamp + timedelta(seconds=offset_seconds)
-            else:
-                adjusted_timestamp = original_timestamp
-
-            # Update all existing populated fields (current behavior)
-            fields_to_update = {}
-            for field_name, value in datetime_fields.items():
-                if value is not None:
-                    fields_to_update[field_name] = adjusted_timestamp
-
-            # NEW: Ensure mandatory fields exist (Option A - use adjusted selected field value)
-            # Includes both EXIF metadata fields and filesystem date fields
-            mandatory_fields = [
-                'DateTimeOriginal', 'CreateDate', 'ModifyDate',  # EXIF metadata fields
-                'FileCreateDate', 'FileModifyDate'  # Filesystem date fields
-            ]
-
-            mandatory_added = []
-            for mandatory_field in mandatory_fields:
-                if mandatory_field not in fields_to_update:
-                    fields_to_update[mandatory_field] = adjusted_timestamp
-                    mandatory_added.append(mandatory_field)
-                    logger.debug(f"Adding missing mandatory field {mandatory_field} to {os.path.basename(file_path)}")
-
-            # DEBUG: Log what fields will be updated
-            logger.info(f"Will update fields in {os.path.basename(file_path)}: {list(fields_to_update.keys())}")
-            logger.info(f"Mandatory fields added: {mandatory_added}")
-            logger.info(f"Target timestamp: {adjusted_timestamp.strftime('%Y:%m:%d %H:%M:%S')}")
-
-            # Apply updates
-            success = self.exif_handler.update_all_datetime_fields(file_path, fields_to_update)
-
-            if success:
-                if mandatory_added:
-                    logger.info(
-                        f"✅ Updated {len(fields_to_update)} fields ({len(mandatory_added)} mandatory fields added) in {os.path.basename(file_path)}")
-                    logger.info(f"Added mandatory fields: {mandatory_added}")
-                else:
-                    logger.debug(f"Updated {len(fields_to_update)} fields in {os.path.basename(file_path)}")
-            else:
-                logger.warning(f"Failed to update fields in {os.path.basename(file_path)}")
+            update = self._build_update_fields(file_path, metadata, selected_field, offset_seconds)
+        except Exception as e:
+            logger.error(f"Error processing single file {os.path.basename(file_path)}: {str(e)}")
+            return False
+        if update is None:
+            return False
 
-            return success
+        return self._write_single_file(file_path, *update)
 
+    def _write_single_file(self, file_path: str, fields_to_update: Dict[str, datetime],
+                           mandatory_added: List[str]) -> bool:
+        """Write the updated fields to one file"""
+        try:
+            success = self.exif_handler.update_all_datetime_fields(file_path, fields_to_update)
         except Exception as e:
             logger.error(f"Error processing single file {os.path.basename(file_path)}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+        if success:
+            self._log_update_success(file_path, fields_to_update, mandatory_added)
+        else:
+            logger.warning(f"Failed to update fields in {os.path.basename(file_path)}")
+
+        return success
+
+    @staticmethod
+    def _log_update_success(file_path: str, fields_to_update: Dict[str, datetime],
+                            mandatory_added: List[str]) -> None:
+        """Log a successful update, at INFO level when mandatory fields were added"""
+        if mandatory_added:
+            logger.info(
+                f"✅ Updated {len(fields_to_update)} fields ({len(mandatory_added)} mandatory fields added) "
+                f"in {os.path.basename(file_path)}")
+            logger.info(f"Added mandatory fields: {mandatory_added}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated %d fields in %s", len(fields_to_update), os.path.basename(file_path))
+
+    def _build_update_fields(self, file_path: str, metadata: dict, selected_field: str,
+                             offset_seconds: float) -> Optional[Tuple[Dict[str, datetime], List[str]]]:
+        """Return the fields to write for one file, or None if it lacks the selected field.
+
+        The mandatory fields that had to be added are returned alongside the
+        fields, so the write can report them once it succeeds.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Single pass over the metadata: remember which datetime fields hold a
+        # parseable value, and the parsed value of the selected one
+        populated_fields = []
+        original_timestamp = None
+        for key, value in metadata.items():
+            if value and TimeCalculator.is_datetime_field(key):
+                parsed_date = TimeCalculator.parse_datetime_cached(str(value))
+                if parsed_date:
+                    populated_fields.append(key)
+                    if key == selected_field:
+                        original_timestamp = parsed_date
+
+        # DEBUG: Log what datetime fields were found
+        if debug:
+            logger.debug("Found datetime fields in %s: %s", os.path.basename(file_path), populated_fields)
+
+        # Check if selected field exists
+        if original_timestamp is None:
+            logger.warning(f"Selected field {selected_field} not found in {os.path.basename(file_path)}")
+            return None
+
+        # Apply offset to selected field
+        if offset_seconds != 0:
+            adjusted_timestamp = original_timestamp + timedelta(seconds=offset_seconds)
+        else:
+            adjusted_timestamp = original_timestamp
+
+        # Update all existing populated fields (current behavior)
+        fields_to_update = dict.fromkeys(populated_fields, adjusted_timestamp)
+
+        # NEW: Ensure mandatory fields exist (Option A - use adjusted selected field value)
+        mandatory_added = []
+        for mandatory_field in MANDATORY_DATETIME_FIELDS:
+            if mandatory_field not in fields_to_update:
+                fields_to_update[mandatory_field] = adjusted_timestamp
+                mandatory_added.append(mandatory_field)
+                if debug:
+                    logger.debug("Adding missing mandatory field %s to %s",
+                                 mandatory_field, os.path.basename(file_path))
+
+        # DEBUG: Log what fields will be updated
+        filename = os.path.basename(file_path)
+        logger.info(f"Will update fields in {filename}: {list(fields_to_update.keys())}")
+        logger.info(f"Mandatory fields added: {mandatory_added}")
+        logger.info(f"Target timestamp: {adjusted_timestamp.strftime('%Y:%m:%d %H:%M:%S')}")
+
+        return fields_to_update, mandatory_added
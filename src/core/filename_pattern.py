@@ -1,11 +1,68 @@
 
 import re
-import os
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Pattern types where a match also requires the same prefix as the reference
+PREFIX_MATCH_TYPES = (
+    'prefix_separator_number', 'prefix_number', 'screenshot_pattern',
+    'generic', 'video_prefix_number', 'gopro_pattern', 'dji_pattern'
+)
+
+# Extended patterns including video-specific ones, tried in order. Compiled
+# once here so extract_pattern doesn't go through re's cache per filename
+PATTERNS = [(re.compile(pattern), pattern_type) for pattern, pattern_type in [
+    # Existing photo patterns
+    (r'^([A-Z]+)([_-])(\d+)$', 'prefix_separator_number'),
+    (r'^(\d{8})([_-])(\d{6})$', 'date_separator_time'),
+    (r'^([A-Za-z]+)\s+(\d{2}-\d{2}-\d{4}),\s+(\d{2}\s+\d{2}\s+\d{2})$', 'word_date_time'),
+    (r'^([A-Z]+)(\d+)$', 'prefix_number'),
+    (r'^(Screenshot)([_-])(\d{8}-\d{6})([_-])(.+)$', 'screenshot_pattern'),
+
+    # Video-specific patterns
+    (r'^(VID|MOV|MVI)([_-])(\d+)$', 'video_prefix_number'),
+    (r'^(VID|VIDEO)([_-])(\d{8})([_-])(\d{6})$', 'video_timestamp'),
+    (r'^(\d{4}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})$', 'video_date_time'),
+    (r'^(Screencast|Recording)([_-])(\d{4}-\d{2}-\d{2})([_-])(\d{2}-\d{2}-\d{2})$', 'screen_recording'),
+
+    # GoPro/Action camera patterns
+    (r'^(GH|GP|GX|GOPR)(\d+)$', 'gopro_pattern'),
+    (r'^(DJI)([_-])(\d+)$', 'dji_pattern'),
+
+    # Generic: any prefix followed by numbers
+    (r'^([^0-9]+)(\d+)(.*)$', 'generic')
+]]
+
+
+def _build_master_pattern(patterns):
+    """Fold the patterns into one alternation with a named group per type.
+
+    Alternatives are tried in list order, so the first branch that matches is
+    the same pattern a sequential scan would pick. Returns the compiled regex and,
+    per type, the per-type regex and the slice of match.groups() holding its groups.
+    """
+    branches = []
+    spans = {}
+    position = 0
+    for pattern, pattern_type in patterns:
+        branches.append(f'(?P<{pattern_type}>{pattern.pattern})')
+        spans[pattern_type] = (pattern, slice(position + 1, position + 1 + pattern.groups))
+        position += 1 + pattern.groups
+    return re.compile('|'.join(branches)), spans
+
+
+MASTER_PATTERN, _PATTERN_SPANS = _build_master_pattern(PATTERNS)
+
+
+def _strip_extension(filename: str) -> str:
+    """os.path.splitext(filename)[0] for a bare filename, without its per-call overhead"""
+    head, dot, _ = filename.rpartition('.')
+    # Leading dots don't start an extension ('.bashrc' keeps its name), as in splitext
+    return head if dot and head.lstrip('.') else filename
+
 
 class FilenamePatternMatcher:
     """Handles filename pattern detection and matching"""
@@ -13,43 +70,19 @@ class FilenamePatternMatcher:
     @staticmethod
     def extract_pattern(filename: str) -> Dict[str, any]:
         """Extract pattern components from a filename"""
-        name_without_ext = os.path.splitext(filename)[0]
-
-        # Extended patterns including video-specific ones
-        patterns = [
-            # Existing photo patterns
-            (r'^([A-Z]+)([_-])(\d+)$', 'prefix_separator_number'),
-            (r'^(\d{8})([_-])(\d{6})$', 'date_separator_time'),
-            (r'^([A-Za-z]+)\s+(\d{2}-\d{2}-\d{4}),\s+(\d{2}\s+\d{2}\s+\d{2})$', 'word_date_time'),
-            (r'^([A-Z]+)(\d+)$', 'prefix_number'),
-            (r'^(Screenshot)([_-])(\d{8}-\d{6})([_-])(.+)$', 'screenshot_pattern'),
-
-            # Video-specific patterns
-            (r'^(VID|MOV|MVI)([_-])(\d+)$', 'video_prefix_number'),
-            (r'^(VID|VIDEO)([_-])(\d{8})([_-])(\d{6})$', 'video_timestamp'),
-            (r'^(\d{4}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})$', 'video_date_time'),
-            (r'^(Screencast|Recording)([_-])(\d{4}-\d{2}-\d{2})([_-])(\d{2}-\d{2}-\d{2})$', 'screen_recording'),
-
-            # GoPro/Action camera patterns
-            (r'^(GH|GP|GX|GOPR)(\d+)$', 'gopro_pattern'),
-            (r'^(DJI)([_-])(\d+)$', 'dji_pattern'),
-
-            # Generic: any prefix followed by numbers
-            (r'^([^0-9]+)(\d+)(.*)$', 'generic')
-        ]
-
-        for pattern, pattern_type in patterns:
-            match = re.match(pattern, name_without_ext)
-            if match:
-                groups = match.groups()
-                result = {
-                    'type': pattern_type,
-                    'pattern': pattern,
-                    'groups': groups,
-                    'display': _format_pattern_display(pattern_type, groups)
-                }
-                logger.debug(f"Extracted pattern from '{filename}': {result}")
-                return result
+        name_without_ext = _strip_extension(filename)
+
+        classified = FilenamePatternMatcher._classify_stem(name_without_ext)
+        if classified:
+            pattern_type, groups = classified
+            result = {
+                'type': pattern_type,
+                'pattern': _PATTERN_SPANS[pattern_type][0],
+                'groups': groups,
+                'display': _format_pattern_display(pattern_type, groups)
+            }
+            logger.debug("Extracted pattern from '%s': %s", filename, result)
+            return result
 
         # No pattern found - just use the full prefix
         result = {
@@ -58,43 +91,85 @@ class FilenamePatternMatcher:
             'groups': [name_without_ext],
             'display': f'Prefix: {name_without_ext[:10]}...' if len(name_without_ext) > 10 else name_without_ext
         }
-        logger.debug(f"No pattern found for '{filename}': {result}")
+        logger.debug("No pattern found for '%s': %s", filename, result)
         return result
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_stem(name_without_ext: str) -> Optional[Tuple[str, tuple]]:
+        """Pattern type and groups for a name without extension, memoized.
+
+        Each scan extracts the reference pattern from both the scanner thread
+        and the file processor, and users tend to rescan the same reference.
+        """
+        match = MASTER_PATTERN.match(name_without_ext)
+        if not match:
+            return None
+        # The type's own named group closes last, so lastgroup names the branch
+        pattern_type = match.lastgroup
+        return pattern_type, match.groups()[_PATTERN_SPANS[pattern_type][1]]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop memoized filename classifications"""
+        FilenamePatternMatcher._classify_stem.cache_clear()
+
     @staticmethod
     def matches_pattern(filename: str, reference_pattern: Dict[str, any]) -> bool:
         """Check if a filename matches the reference pattern"""
-        name_without_ext = os.path.splitext(filename)[0]
+        name_without_ext = _strip_extension(filename)
 
         if reference_pattern['type'] == 'no_pattern':
             # For no pattern, just check if it starts with the same prefix
             matches = name_without_ext.startswith(reference_pattern['groups'][0])
-            logger.debug(
-                f"Pattern match check (no_pattern) '{filename}' vs '{reference_pattern['groups'][0]}': {matches}")
+            logger.debug("Pattern match check (no_pattern) '%s' vs '%s': %s",
+                         filename, reference_pattern['groups'][0], matches)
             return matches
 
         # Check if filename matches the same pattern
         if reference_pattern['pattern']:
-            match = re.match(reference_pattern['pattern'], name_without_ext)
+            match = reference_pattern['pattern'].match(name_without_ext)
             if match:
                 # For these patterns, we want exact prefix match
-                if reference_pattern['type'] in [
-                    'prefix_separator_number', 'prefix_number', 'screenshot_pattern',
-                    'generic', 'video_prefix_number', 'gopro_pattern', 'dji_pattern'
-                ]:
+                if reference_pattern['type'] in PREFIX_MATCH_TYPES:
                     ref_prefix = reference_pattern['groups'][0]
                     file_prefix = match.groups()[0]
                     matches = ref_prefix == file_prefix
-                    logger.debug(
-                        f"Pattern match check ({reference_pattern['type']}) '{filename}' prefix '{file_prefix}' vs '{ref_prefix}': {matches}")
+                    logger.debug("Pattern match check (%s) '%s' prefix '%s' vs '%s': %s",
+                                 reference_pattern['type'], filename, file_prefix, ref_prefix, matches)
                     return matches
-                logger.debug(f"Pattern match check (other) '{filename}' matches pattern: True")
+                logger.debug("Pattern match check (other) '%s' matches pattern: True", filename)
                 return True
             else:
-                logger.debug(f"Pattern match check '{filename}' doesn't match pattern {reference_pattern['pattern']}")
+                logger.debug("Pattern match check '%s' doesn't match pattern %s",
+                             filename, reference_pattern['pattern'].pattern)
 
         return False
 
+    @staticmethod
+    def compile(reference_pattern: Dict[str, any]) -> 're.Pattern':
+        """Compile a reference pattern into one regex for matching many filenames.
+
+        The regex is applied with match() to names without extension and gives
+        the same result as matches_pattern, so callers filtering a whole folder
+        build it once instead of re-evaluating the pattern dict per file.
+        """
+        if reference_pattern['type'] == 'no_pattern':
+            return re.compile(re.escape(reference_pattern['groups'][0]))
+
+        if not reference_pattern['pattern']:
+            # Never matches, like matches_pattern without a pattern
+            return re.compile(r'(?!)')
+
+        pattern = reference_pattern['pattern'].pattern
+
+        if reference_pattern['type'] in PREFIX_MATCH_TYPES:
+            # Pin the first group to the reference prefix instead of comparing afterwards
+            first_group_end = pattern.index(')') + 1
+            pattern = '^(' + re.escape(reference_pattern['groups'][0]) + ')' + pattern[first_group_end:]
+
+        return re.compile(pattern)
+
 
 def _format_pattern_display(pattern_type: str, groups: tuple) -> str:
     """Format pattern for display to user"""
@@ -1,17 +1,31 @@
 # src/core/repair_strategies.py - Robust repair strategies with Windows path fixes
 
 import os
+import re
 import tempfile
-import subprocess
 import shutil
 import logging
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from .corruption_detector import CorruptionType
+from .exiftool_process import ExifToolProcess
 
 logger = logging.getLogger(__name__)
 
+# Timeouts for one repair write and for the verification write
+REPAIR_TIMEOUT = 60.0
+VERIFY_TIMEOUT = 30.0
+
+# ExifTool's summary lines, e.g. "    1 image files updated" or
+# "    1 files weren't updated due to errors"; the outcome is the second group
+SUMMARY_RE = re.compile(r"(\d+) (?:image )?files (updated|unchanged|created|weren't|could not)")
+
+# Files repaired at once by repair_files, each worker with its own ExifTool process
+REPAIR_WORKERS = 4
+
 
 class RepairStrategy(Enum):
     SAFEST = "safest"
@@ -20,6 +34,36 @@ class RepairStrategy(Enum):
     FILESYSTEM_ONLY = "filesystem_only"
 
 
+def _try_link(file_path: str, backup_path: str) -> bool:
+    """Back up a file as a hard link, returning False if it can't be linked.
+
+    Every ExifTool write here uses -overwrite_original, which writes a new file
+    and renames it over the original, so the linked inode keeps the original
+    bytes without copying them. Linking fails across devices or on filesystems
+    without hard links, where callers fall back to shutil.copy2.
+    """
+    try:
+        os.link(file_path, backup_path)
+        return True
+    except OSError:
+        return False
+
+
+def _link_or_copy(file_path: str, backup_path: str) -> None:
+    """Back up a file as a hard link, falling back to a full copy"""
+    if not _try_link(file_path, backup_path):
+        # shutil.copy2 handles Unicode paths and metadata better
+        shutil.copy2(file_path, backup_path)
+
+
+def _restore_backup(backup_path: str, file_path: str) -> None:
+    """Copy a backup over the file, unless the file is still the backed-up original"""
+    # A write that failed before ExifTool's rename leaves the file linked to the backup
+    if os.path.exists(file_path) and os.path.samefile(backup_path, file_path):
+        return
+    shutil.copy2(backup_path, file_path)
+
+
 @dataclass
 class RepairResult:
     strategy_used: RepairStrategy
@@ -34,6 +78,12 @@ class FileRepairer:
 
     def __init__(self, exiftool_path: str = "exiftool"):
         self.exiftool_path = exiftool_path
+        # Persistent -stay_open ExifTool per repairing thread, started on first use
+        self._local = threading.local()
+        self._exiftools = []
+        self._exiftool_lock = threading.Lock()
+        # Held while choosing and claiming a backup name
+        self._backup_lock = threading.Lock()
 
         # Define repair strategies in order of preference
         self.strategies = [
@@ -43,6 +93,81 @@ class FileRepairer:
             RepairStrategy.FILESYSTEM_ONLY
         ]
 
+        # Narrower automatic orders for corruption types where the default one
+        # wastes writes. Files without EXIF are often writable as they are, and
+        # otherwise only AGGRESSIVE adds the EXIF structure they lack
+        self.strategies_by_type = {
+            CorruptionType.FILESYSTEM_ONLY: [RepairStrategy.FILESYSTEM_ONLY, RepairStrategy.AGGRESSIVE],
+        }
+
+    def close(self):
+        """Stop the persistent ExifTool processes started so far"""
+        with self._exiftool_lock:
+            exiftools, self._exiftools = self._exiftools, []
+            self._local = threading.local()
+        for exiftool in exiftools:
+            exiftool.stop()
+
+    def _run_exiftool(self, args: List[str], timeout: float) -> str:
+        """Run one ExifTool command on this thread's persistent process and return its stdout.
+
+        The process is started on first use, so each repair step costs one
+        command round-trip instead of an ExifTool start-up. ExifTool's stderr
+        is not read in -stay_open mode, so failures show up only in the summary.
+        """
+        exiftool = getattr(self._local, 'exiftool', None)
+        if exiftool is None:
+            exiftool = ExifToolProcess(self.exiftool_path)
+            exiftool.start()
+            with self._exiftool_lock:
+                self._exiftools.append(exiftool)
+            self._local.exiftool = exiftool
+        return exiftool.execute_command(args, timeout)
+
+    @staticmethod
+    def _summary_counts(output: str) -> Dict[str, int]:
+        """File counts from ExifTool's summary lines, keyed by outcome, in one pass"""
+        return {outcome: int(count) for count, outcome in SUMMARY_RE.findall(output)}
+
+    @staticmethod
+    def _command_succeeded(counts: Dict[str, int]) -> bool:
+        """Whether a write command finished without file errors (exit status 0 outside -stay_open)"""
+        return ('updated' in counts or 'unchanged' in counts) and \
+            not counts.get("weren't") and not counts.get('could not')
+
+    def repair_files(self, items: List[Tuple[str, CorruptionType]], backup_dir: str,
+                     force_strategy: bool = False, selected_strategy: RepairStrategy = None,
+                     max_workers: int = REPAIR_WORKERS) -> Iterator[Tuple[str, RepairResult]]:
+        """Repair several files in parallel, yielding (file_path, result) as each finishes.
+
+        Repairs are bound by ExifTool rather than Python, so worker threads
+        are enough; each drives its own persistent ExifTool process.
+        """
+        if not items:
+            return
+
+        workers = max(1, min(max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="FileRepairer") as executor:
+            futures = {
+                executor.submit(self.repair_file, file_path, corruption_type, backup_dir,
+                                force_strategy, selected_strategy): file_path
+                for file_path, corruption_type in items
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Exception during repair of {os.path.basename(file_path)}: {e}")
+                    result = RepairResult(
+                        strategy_used=selected_strategy if selected_strategy else RepairStrategy.SAFEST,
+                        success=False,
+                        error_message=str(e),
+                        verification_passed=False,
+                        backup_path=""
+                    )
+                yield file_path, result
+
     def repair_file(self, file_path: str, corruption_type: CorruptionType,
                     backup_dir: str, force_strategy: bool = False,
                     selected_strategy: RepairStrategy = None) -> RepairResult:
@@ -70,15 +195,27 @@ class FileRepairer:
             strategies_to_try = [selected_strategy]
         else:
             # Use automatic progression
-            strategies_to_try = self.strategies
+            strategies_to_try = self.strategies_by_type.get(corruption_type, self.strategies)
+            if RepairStrategy.SAFEST in strategies_to_try:
+                # THOROUGH sends SAFEST's write again (-f only forces printing of
+                # missing tags), so it can't succeed where SAFEST failed
+                strategies_to_try = [
+                    strategy for strategy in strategies_to_try if strategy != RepairStrategy.THOROUGH
+                ]
 
-        # Try each strategy in order until one works
+        # Try each strategy in order until one works. The file only needs restoring
+        # from the backup once an earlier attempt may have written to it
+        file_modified = False
         for strategy in strategies_to_try:
             logger.debug(f"Trying {strategy.value} repair on {os.path.basename(file_path)}")
 
             try:
-                # Restore from backup before each attempt
-                shutil.copy2(backup_path, file_path)
+                if file_modified:
+                    _restore_backup(backup_path, file_path)
+                    file_modified = False
+
+                # Filesystem-only repair leaves the file untouched
+                file_modified = strategy != RepairStrategy.FILESYSTEM_ONLY
 
                 # Apply repair strategy (single-step, robust approach)
                 repair_success, repair_error = self._apply_single_step_repair(file_path, strategy)
@@ -140,10 +277,11 @@ class FileRepairer:
                 continue
 
         # All strategies failed - restore backup and return failure
-        try:
-            shutil.copy2(backup_path, file_path)
-        except Exception as e:
-            logger.error(f"Failed to restore backup for {file_path}: {e}")
+        if file_modified:
+            try:
+                _restore_backup(backup_path, file_path)
+            except Exception as e:
+                logger.error(f"Failed to restore backup for {file_path}: {e}")
 
         return RepairResult(
             strategy_used=strategies_to_try[-1] if strategies_to_try else RepairStrategy.FILESYSTEM_ONLY,
@@ -183,18 +321,31 @@ class FileRepairer:
                 backup_path = os.path.join(backup_dir, backup_filename)
                 logger.debug(f"Using shortened backup path: {backup_path}")
 
-            # Handle file already exists case
-            counter = 1
-            original_backup_path = backup_path
-            while os.path.exists(backup_path):
-                name_part, ext_part = os.path.splitext(original_backup_path)
-                backup_path = f"{name_part}_{counter}{ext_part}"
-                counter += 1
-                if counter > 100:  # Prevent infinite loop
-                    raise Exception("Too many backup files exist")
-
-            # Use shutil.copy2 which handles Unicode and metadata better
-            shutil.copy2(file_path, backup_path)
+            # Pick a free name and claim it under the lock, so files with the
+            # same name repaired in parallel never share a backup path
+            with self._backup_lock:
+                # Handle file already exists case
+                counter = 1
+                original_backup_path = backup_path
+                while os.path.exists(backup_path):
+                    name_part, ext_part = os.path.splitext(original_backup_path)
+                    backup_path = f"{name_part}_{counter}{ext_part}"
+                    counter += 1
+                    if counter > 100:  # Prevent infinite loop
+                        raise Exception("Too many backup files exist")
+
+                linked = _try_link(file_path, backup_path)
+                if not linked:
+                    open(backup_path, 'xb').close()
+
+            if not linked:
+                # Copy outside the lock; shutil.copy2 handles Unicode paths and metadata better
+                try:
+                    shutil.copy2(file_path, backup_path)
+                except Exception:
+                    # Don't leave the empty placeholder behind as a backup
+                    os.remove(backup_path)
+                    raise
             logger.debug(f"Created backup: {os.path.basename(backup_path)}")
 
             return backup_path
@@ -213,7 +364,7 @@ class FileRepairer:
                 backup_filename = f"backup_{hash(file_path) % 10000}{ext}"
                 backup_path = os.path.join(temp_backup_dir, backup_filename)
 
-                shutil.copy2(file_path, backup_path)
+                _link_or_copy(file_path, backup_path)
                 logger.warning(f"Created backup in temp directory: {temp_backup_dir}")
 
                 return backup_path
@@ -225,74 +376,62 @@ class FileRepairer:
     def _apply_single_step_repair(self, file_path: str, strategy: RepairStrategy) -> Tuple[bool, str]:
         """Apply repair strategy using single, robust command"""
 
-        # Create argument file for Unicode safety (like your existing code)
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-            arg_file.write(file_path + '\n')
-            arg_file_path = arg_file.name
-
-        try:
-            if strategy == RepairStrategy.SAFEST:
-                return self._safest_single_step(arg_file_path)
-            elif strategy == RepairStrategy.THOROUGH:
-                return self._thorough_single_step(arg_file_path)
-            elif strategy == RepairStrategy.AGGRESSIVE:
-                return self._aggressive_single_step(arg_file_path)
-            elif strategy == RepairStrategy.FILESYSTEM_ONLY:
-                return True, "Filesystem-only (no repair needed)"
-            else:
-                return False, f"Unknown strategy: {strategy}"
-
-        finally:
-            if os.path.exists(arg_file_path):
-                os.remove(arg_file_path)
+        # The path goes inline: the stay_open stdin is itself a UTF-8 argument file
+        if strategy == RepairStrategy.SAFEST:
+            return self._safest_single_step(file_path)
+        elif strategy == RepairStrategy.THOROUGH:
+            return self._thorough_single_step(file_path)
+        elif strategy == RepairStrategy.AGGRESSIVE:
+            return self._aggressive_single_step(file_path)
+        elif strategy == RepairStrategy.FILESYSTEM_ONLY:
+            return True, "Filesystem-only (no repair needed)"
+        else:
+            return False, f"Unknown strategy: {strategy}"
 
-    def _safest_single_step(self, arg_file_path: str) -> Tuple[bool, str]:
+    def _safest_single_step(self, file_path: str) -> Tuple[bool, str]:
         """Safest repair - single command, minimal changes"""
         # Just try to read and rewrite the file with error handling
         cmd = [
-            self.exiftool_path,
             '-overwrite_original',
             '-ignoreMinorErrors',
             '-m',
             '-charset', 'filename=utf8',
             '-all=',  # Clear problematic metadata
-            '-@', arg_file_path
+            file_path
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            success = result.returncode == 0 and (
-                    "1 image files updated" in result.stdout or "updated" in result.stdout.lower())
-            return success, result.stderr or result.stdout
+            output = self._run_exiftool(cmd, REPAIR_TIMEOUT)
+            counts = self._summary_counts(output)
+            success = self._command_succeeded(counts) and 'updated' in counts
+            return success, output
         except Exception as e:
             return False, str(e)
 
-    def _thorough_single_step(self, arg_file_path: str) -> Tuple[bool, str]:
+    def _thorough_single_step(self, file_path: str) -> Tuple[bool, str]:
         """Thorough repair - single command to rebuild structure"""
         # Clear all metadata in one robust operation
         cmd = [
-            self.exiftool_path,
             '-overwrite_original',
             '-ignoreMinorErrors',
             '-m',
             '-f',  # Force operation
             '-charset', 'filename=utf8',
             '-all=',  # Remove all metadata
-            '-@', arg_file_path
+            file_path
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            success = result.returncode == 0
-            return success, result.stderr or result.stdout
+            output = self._run_exiftool(cmd, REPAIR_TIMEOUT)
+            success = self._command_succeeded(self._summary_counts(output))
+            return success, output
         except Exception as e:
             return False, str(e)
 
-    def _aggressive_single_step(self, arg_file_path: str) -> Tuple[bool, str]:
+    def _aggressive_single_step(self, file_path: str) -> Tuple[bool, str]:
         """Aggressive repair - force clear everything and add minimal structure"""
         # First clear everything forcefully
         cmd1 = [
-            self.exiftool_path,
             '-overwrite_original',
             '-ignoreMinorErrors',
             '-m',
@@ -300,91 +439,79 @@ class FileRepairer:
             '-G',  # Ignore structure errors
             '-charset', 'filename=utf8',
             '-all=',  # Clear all metadata
-            '-@', arg_file_path
+            file_path
         ]
 
         try:
-            result1 = subprocess.run(cmd1, capture_output=True, text=True, timeout=60)
-            if result1.returncode != 0:
-                return False, f"Clear step failed: {result1.stderr}"
+            output1 = self._run_exiftool(cmd1, REPAIR_TIMEOUT)
+            if not self._command_succeeded(self._summary_counts(output1)):
+                return False, f"Clear step failed: {output1}"
 
             # Then add minimal EXIF structure
             cmd2 = [
-                self.exiftool_path,
                 '-overwrite_original',
                 '-charset', 'filename=utf8',
                 '-EXIF:ExifVersion=0232',  # Add minimal EXIF
-                '-@', arg_file_path
+                file_path
             ]
 
-            result2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=60)
-            success = result2.returncode == 0
-            return success, result2.stderr or result2.stdout
+            output2 = self._run_exiftool(cmd2, REPAIR_TIMEOUT)
+            success = self._command_succeeded(self._summary_counts(output2))
+            return success, output2
 
         except Exception as e:
             return False, str(e)
 
     def _verify_repair(self, file_path: str) -> bool:
-        """Verify repair by testing datetime update with path handling"""
-        # Create backup path with better handling
+        """Verify repair by testing a datetime update on a scratch copy.
+
+        ExifTool writes the updated file to a separate output path (-o), so the
+        repaired file is never modified and needs no backup and restore.
+        """
+        # The output keeps the original extension; with another one ExifTool
+        # would write a metadata sidecar instead of the full file
+        extension = os.path.splitext(file_path)[1]
         try:
-            # Use a simpler backup name to avoid path issues
-            backup_dir = os.path.dirname(file_path)
-            backup_filename = f"verify_temp_{hash(file_path) % 10000}.bak"
-            backup_path = os.path.join(backup_dir, backup_filename)
+            # Use a simple name next to the file to avoid path issues
+            # Each thread verifies one file at a time, so its id keeps the name unique
+            output_filename = f"verify_temp_{threading.get_ident()}_{hash(file_path) % 10000}{extension}"
+            output_path = os.path.join(os.path.dirname(file_path), output_filename)
 
-            # If backup path is still too long, use temp directory
-            if len(backup_path) > 250:
-                temp_dir = tempfile.gettempdir()
-                backup_path = os.path.join(temp_dir, backup_filename)
+            # If the path is still too long, use temp directory
+            if len(output_path) > 250:
+                output_path = os.path.join(tempfile.gettempdir(), output_filename)
 
         except Exception:
             # Fallback to simple temp file
-            backup_path = tempfile.mktemp(suffix=".bak", prefix="verify_")
+            output_path = tempfile.mktemp(suffix=extension, prefix="verify_")
 
         try:
-            # Create backup for verification test
-            shutil.copy2(file_path, backup_path)
+            # ExifTool refuses to overwrite an existing output file
+            if os.path.exists(output_path):
+                os.remove(output_path)
 
             # Try updating a datetime field using same approach as main app
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as arg_file:
-                arg_file.write(file_path + '\n')
-                arg_file_path = arg_file.name
-
-            try:
-                cmd = [
-                    self.exiftool_path,
-                    '-overwrite_original',
-                    '-ignoreMinorErrors',
-                    '-m',
-                    '-charset', 'filename=utf8',
-                    '-CreateDate=2021:06:15 14:30:00',
-                    '-@', arg_file_path
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                success = "1 image files updated" in result.stdout or "1 files updated" in result.stdout
+            cmd = [
+                '-ignoreMinorErrors',
+                '-m',
+                '-charset', 'filename=utf8',
+                '-CreateDate=2021:06:15 14:30:00',
+                '-o', output_path,
+                file_path
+            ]
 
-                logger.debug(f"Verification result: {success}, output: {result.stdout}")
-                return success
+            output = self._run_exiftool(cmd, VERIFY_TIMEOUT)
+            success = self._summary_counts(output).get('created') == 1
 
-            finally:
-                if os.path.exists(arg_file_path):
-                    os.remove(arg_file_path)
+            logger.debug(f"Verification result: {success}, output: {output}")
+            return success
 
         except Exception as e:
             logger.debug(f"Verification test failed: {e}")
             return False
         finally:
-            # Restore from backup after verification test
-            if os.path.exists(backup_path):
+            if os.path.exists(output_path):
                 try:
-                    shutil.move(backup_path, file_path)
+                    os.remove(output_path)
                 except Exception as e:
-                    logger.error(f"Failed to restore after verification: {e}")
-                    # Try copying instead of moving
-                    try:
-                        shutil.copy2(backup_path, file_path)
-                        os.remove(backup_path)
-                    except Exception as e2:
-                        logger.error(f"Failed to copy restore: {e2}")
\ No newline at end of file
+                    logger.error(f"Failed to remove verification output: {e}")
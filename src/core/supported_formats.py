@@ -19,11 +19,27 @@ SUPPORTED_FORMATS = {
     }
 }
 
-# Combine all formats into a single set
-ALL_SUPPORTED_EXTENSIONS = set()
-for category in SUPPORTED_FORMATS.values():
-    for format_set in category.values():
-        ALL_SUPPORTED_EXTENSIONS.update(format_set)
+# Combine all formats into a single immutable set (safe to share across threads)
+ALL_SUPPORTED_EXTENSIONS = frozenset(
+    ext.lower()
+    for category in SUPPORTED_FORMATS.values()
+    for format_set in category.values()
+    for ext in format_set
+)
+
+# Formats with no place for EXIF/XMP camera tags; ExifTool never reports a
+# Make or Model for them, so camera matching can skip reading them
+NO_CAMERA_METADATA_EXTENSIONS = frozenset({'.bmp', '.pbm', '.pgm', '.ppm'})
+
+# ISO base media (QuickTime-style) containers among the formats above; their
+# metadata atoms may be written after the media data
+QUICKTIME_BASED_EXTENSIONS = frozenset({
+    '.mov', '.mp4', '.m4v', '.f4v', '.3gp', '.3g2', '.heic', '.heif', '.avif'
+})
+
+# Formats that can keep their camera tags after the media data, where
+# ExifTool's -fast2 stops reading
+FAST2_UNSAFE_EXTENSIONS = QUICKTIME_BASED_EXTENSIONS | {'.png'}
 
 
 # Helper functions
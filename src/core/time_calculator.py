@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 from typing import Optional, Tuple
 from dateutil import parser
@@ -6,6 +7,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Plain EXIF timestamp ("YYYY:MM:DD HH:MM:SS"), by far the most common value
+_EXIF_DATETIME_RE = re.compile(r'(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})', re.ASCII)
+
 
 class TimeCalculator:
     """Handles time offset calculations and datetime parsing"""
@@ -16,6 +20,16 @@ class TimeCalculator:
         if not date_string:
             return None
 
+        # Fast path: build plain EXIF timestamps directly instead of going through dateutil.
+        # Anything else, including invalid dates such as 0000:00:00, takes the full path below
+        if isinstance(date_string, str):
+            match = _EXIF_DATETIME_RE.fullmatch(date_string.strip())
+            if match:
+                try:
+                    return datetime(*map(int, match.groups()))
+                except ValueError:
+                    pass
+
         try:
             # Clean the date string first
             original_string = date_string
@@ -23,15 +37,15 @@ class TimeCalculator:
 
             # Skip obviously invalid date strings (like timezone offsets or partial dates)
             if len(date_string) < 10 or date_string in ['+00:00', '+01:00', '+02:00', '+03:00', 'UTC', 'GMT']:
-                logger.debug(f"Skipping partial/timezone string: '{original_string}'")
+                logger.debug("Skipping partial/timezone string: '%s'", original_string)
                 return None
 
             # Skip numeric-only strings that are too short to be dates
             if date_string.isdigit() and len(date_string) < 8:
-                logger.debug(f"Skipping short numeric string: '{original_string}'")
+                logger.debug("Skipping short numeric string: '%s'", original_string)
                 return None
 
-            logger.debug(f"Parsing datetime - Original: '{original_string}', Cleaned: '{date_string}'")
+            logger.debug("Parsing datetime - Original: '%s', Cleaned: '%s'", original_string, date_string)
 
             # First try common EXIF format explicitly
             if ':' in date_string:
@@ -54,9 +68,9 @@ class TimeCalculator:
                                     return None
 
                         date_string = f"{date_part} {time_part}".strip()
-                        logger.debug(f"Reformatted date string: '{date_string}'")
+                        logger.debug("Reformatted date string: '%s'", date_string)
                 except Exception as e:
-                    logger.debug(f"Error reformatting date: {e}")
+                    logger.debug("Error reformatting date: %s", e)
 
             # Try parsing with dateutil
             dt = parser.parse(date_string, dayfirst=False)
@@ -65,11 +79,11 @@ class TimeCalculator:
             if dt.tzinfo is not None:
                 dt = dt.replace(tzinfo=None)
 
-            logger.debug(f"Successfully parsed: {dt}")
+            logger.debug("Successfully parsed: %s", dt)
             return dt
 
         except (ValueError, TypeError) as e:
-            logger.debug(f"dateutil parsing failed: {e}, trying manual formats...")
+            logger.debug("dateutil parsing failed: %s, trying manual formats...", e)
 
             # Try manual parsing for common EXIF and video formats
             formats = [
@@ -100,7 +114,7 @@ class TimeCalculator:
                     # Strip timezone if present
                     if dt.tzinfo is not None:
                         dt = dt.replace(tzinfo=None)
-                    logger.debug(f"Successfully parsed with format {fmt}: {dt}")
+                    logger.debug("Successfully parsed with format %s: %s", fmt, dt)
                     return dt
                 except ValueError:
                     continue
@@ -108,6 +122,23 @@ class TimeCalculator:
             logger.warning(f"Failed to parse datetime: '{original_string}'")
             return None
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_datetime_cached(date_string: str) -> Optional[datetime]:
+        """parse_datetime_naive memoized on the raw string.
+
+        The same timestamp usually appears in several fields of a file and
+        across files shot together, so repeated values skip the parse.
+        """
+        return TimeCalculator.parse_datetime_naive(date_string)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def is_datetime_field(field_name: str) -> bool:
+        """Check whether a metadata tag name refers to a date or time field"""
+        name = field_name.lower()
+        return 'date' in name or 'time' in name
+
     @staticmethod
     def _clean_date_string(date_string: str) -> str:
         """Clean up date string for parsing"""
@@ -10,7 +10,7 @@ class FileScannerThread(QThread):
     """Worker thread for async file scanning"""
 
     # Signals
-    file_found = pyqtSignal(str)
+    files_found = pyqtSignal(list)
     scanning_complete = pyqtSignal()
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
@@ -44,7 +44,7 @@ class FileScannerThread(QThread):
                 self.use_camera,
                 self.use_extension,
                 self.use_pattern,
-                self.file_found
+                self.files_found
             )
 
             self.scanning_complete.emit()
@@ -11,6 +11,9 @@ from ..core import ExifHandler, ConfigManager, FileProcessor, TimeCalculator
 from ..utils import FileProcessingError
 from .file_scanner_thread import FileScannerThread
 from ..core.supported_formats import is_supported_format
+from ..core.file_processor import CAMERA_MATCH_BATCH_SIZE
+from ..core.camera_info_cache import CameraInfoCache
+from ..core.alignment_report import count_files_in_folder
 from .progress_dialog import ProgressDialog
 from .metadata_dialog import MetadataInvestigationDialog
 import logging
@@ -74,7 +77,12 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.config_manager = config_manager
         self.exif_handler = exif_handler
-        self.file_processor = FileProcessor(self.exif_handler)
+        self.camera_cache = self._open_camera_cache()
+        self.file_processor = FileProcessor(
+            self.exif_handler,
+            batch_size=config_manager.get('performance.batch_size', CAMERA_MATCH_BATCH_SIZE),
+            camera_cache=self.camera_cache
+        )
         self.reference_file = None
         self.target_file = None
         self.reference_metadata = {}
@@ -739,7 +747,7 @@ class MainWindow(QMainWindow):
         )
 
         # Connect signals
-        self.ref_scanner_thread.file_found.connect(self._on_reference_file_found)
+        self.ref_scanner_thread.files_found.connect(self._on_reference_files_found)
         self.ref_scanner_thread.scanning_complete.connect(self._on_reference_scanning_complete)
         self.ref_scanner_thread.error.connect(self._on_reference_scan_error)
         self.ref_scanner_thread.status_update.connect(
@@ -780,7 +788,7 @@ class MainWindow(QMainWindow):
         )
 
         # Connect signals
-        self.target_scanner_thread.file_found.connect(self._on_target_file_found)
+        self.target_scanner_thread.files_found.connect(self._on_target_files_found)
         self.target_scanner_thread.scanning_complete.connect(self._on_target_scanning_complete)
         self.target_scanner_thread.error.connect(self._on_target_scan_error)
         self.target_scanner_thread.status_update.connect(
@@ -792,27 +800,29 @@ class MainWindow(QMainWindow):
 
         self.target_scanner_thread.start()
 
-    def _on_reference_file_found(self, file_path: str):
-        """Handle individual file found by reference scanner thread"""
-        self.reference_group_files.append(file_path)
-        self.ref_files_list.addItem(os.path.basename(file_path))
+    def _on_reference_files_found(self, file_paths: list):
+        """Handle a chunk of files found by reference scanner thread"""
+        self.reference_group_files.extend(file_paths)
+        self.ref_files_list.addItems([os.path.basename(path) for path in file_paths])
         self.ref_file_count.setText(f"Matching files: {len(self.reference_group_files)}")
 
-    def _on_target_file_found(self, file_path: str):
-        """Handle individual file found by target scanner thread"""
-        self.target_group_files.append(file_path)
-        self.target_files_list.addItem(os.path.basename(file_path))
+    def _on_target_files_found(self, file_paths: list):
+        """Handle a chunk of files found by target scanner thread"""
+        self.target_group_files.extend(file_paths)
+        self.target_files_list.addItems([os.path.basename(path) for path in file_paths])
         self.target_file_count.setText(f"Matching files: {len(self.target_group_files)}")
 
     def _on_reference_scanning_complete(self):
         """Handle completion of reference file scanning"""
         logger.info(f"Reference scanning complete, found {len(self.reference_group_files)} matching files")
         self.reference_group_files.sort()
+        self.ref_files_list.sortItems()
 
     def _on_target_scanning_complete(self):
         """Handle completion of target file scanning"""
         logger.info(f"Target scanning complete, found {len(self.target_group_files)} matching files")
         self.target_group_files.sort()
+        self.target_files_list.sortItems()
 
     def _on_reference_scan_error(self, error_msg: str):
         """Handle scanning errors"""
@@ -1173,18 +1183,11 @@ class MainWindow(QMainWindow):
             folder_org = "Camera-specific subfolders" if use_camera_folders else "Root folder"
             report.append(f"Master Folder Organization: {folder_org}")
             for camera_id, folder_path in sorted(status.camera_folders.items()):
-                file_count = self._count_files_in_folder(folder_path)
+                file_count = count_files_in_folder(folder_path)
                 report.append(f"- {folder_path}: {file_count} files")
 
         return "\n".join(report)
 
-    def _count_files_in_folder(self, folder_path: str) -> int:
-        """Count the number of files in a folder"""
-        try:
-            return len([f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))])
-        except:
-            return 0
-
     def show_results_dialog(self, status, report_text):
         """Show enhanced results dialog with selectable backup paths"""
         from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTextEdit, QDialogButtonBox,
@@ -1702,6 +1705,16 @@ class MainWindow(QMainWindow):
             container.deleteLater()
         self.target_time_radios.clear()
 
+    def _open_camera_cache(self) -> Optional[CameraInfoCache]:
+        """Open the persistent camera info cache, if enabled in the performance settings"""
+        if not self.config_manager.get('performance.cache_enabled', True):
+            return None
+        try:
+            return CameraInfoCache(self.config_manager.config_dir / 'camera_info.sqlite3')
+        except Exception as e:
+            logger.warning(f"Camera info cache unavailable, reading all files with ExifTool: {e}")
+            return None
+
     def closeEvent(self, event):
         """Save configuration on close"""
         # Terminate any running threads
@@ -1713,6 +1726,10 @@ class MainWindow(QMainWindow):
             self.target_scanner_thread.stop()
             self.target_scanner_thread.wait()
 
+        self.file_processor.shutdown()
+        if self.camera_cache:
+            self.camera_cache.close()
+
         # Save configuration
         self.config_manager.set('window_geometry', {
             'x': self.geometry().x(),
@@ -0,0 +1,80 @@
+"""
+Unit tests for the persistent camera info cache.
+"""
+import os
+import sys
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.camera_info_cache import CameraInfoCache
+
+
+@pytest.fixture
+def cache_dir():
+    """Temporary directory holding the cache database and a few photos"""
+    temp_dir = tempfile.mkdtemp(prefix='test_camera_cache_')
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestCameraInfoCache:
+    """Tests for storing and validating cached camera info"""
+
+    def test_hit_survives_reopen(self, cache_dir):
+        """Test that stored entries are found again after reopening the database"""
+        photo = Path(cache_dir, 'Tur på fjellet.jpg')
+        photo.write_bytes(b'photo')
+        signature = CameraInfoCache.signature(str(photo))
+        db_path = os.path.join(cache_dir, 'cache', 'camera_info.sqlite3')
+
+        cache = CameraInfoCache(db_path)
+        cache.store([(str(photo), signature, ('Canon', 'EOS R5'))])
+        cache.close()
+
+        cache = CameraInfoCache(db_path)
+        assert cache.lookup({str(photo): signature}) == {str(photo): ('Canon', 'EOS R5')}
+        cache.close()
+
+    def test_changed_file_is_a_miss(self, cache_dir):
+        """Test that a different size or mtime invalidates the cached entry"""
+        photo = Path(cache_dir, 'IMG_0001.jpg')
+        photo.write_bytes(b'photo')
+        signature = CameraInfoCache.signature(str(photo))
+        cache = CameraInfoCache(os.path.join(cache_dir, 'camera_info.sqlite3'))
+        cache.store([(str(photo), signature, ('Canon', 'EOS R5'))])
+
+        photo.write_bytes(b'photo with new metadata')
+
+        assert cache.lookup({str(photo): CameraInfoCache.signature(str(photo))}) == {}
+        cache.close()
+
+    def test_missing_file_has_no_signature(self, cache_dir):
+        """Test that files that can't be stat'ed are not looked up"""
+        assert CameraInfoCache.signature(os.path.join(cache_dir, 'missing.jpg')) is None
+
+    def test_f4v_rows_from_before_versioning_are_dropped(self, cache_dir):
+        """Test that F4V entries cached by an unversioned database are read again"""
+        photo, video = Path(cache_dir, 'IMG_0001.jpg'), Path(cache_dir, 'clip.F4V')
+        photo.write_bytes(b'photo')
+        video.write_bytes(b'video')
+        signatures = {str(path): CameraInfoCache.signature(str(path)) for path in (photo, video)}
+        db_path = os.path.join(cache_dir, 'camera_info.sqlite3')
+
+        cache = CameraInfoCache(db_path)
+        cache.store([(path, signature, ('', '')) for path, signature in signatures.items()])
+        with cache._conn:
+            cache._conn.execute("PRAGMA user_version = 0")
+        cache.close()
+
+        cache = CameraInfoCache(db_path)
+        assert cache.lookup(signatures) == {str(photo): ('', '')}
+        cache.store([(str(video), signatures[str(video)], ('', ''))])
+        cache.close()
+
+        cache = CameraInfoCache(db_path)
+        assert len(cache.lookup(signatures)) == 2
+        cache.close()
@@ -0,0 +1,42 @@
+"""Tests for ConfigManager loading and migration"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.config_manager import ConfigManager
+
+
+@pytest.fixture
+def write_config(tmp_path, monkeypatch):
+    """Point APPDATA at tmp_path and write a saved config there"""
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+
+    def write(config):
+        config_dir = tmp_path / 'PhotoTimeAligner'
+        config_dir.mkdir()
+        (config_dir / 'config.json').write_text(json.dumps(config))
+
+    return write
+
+
+class TestBatchSizeMigration:
+    """Tests for the saved performance.batch_size setting"""
+
+    def test_legacy_default_is_raised(self, write_config):
+        """Test that the batch size saved under the old default picks up the new default"""
+        write_config({'performance': {'batch_size': 20, 'exiftool_pool_size': 5}})
+
+        config = ConfigManager()
+
+        assert config.get('performance.batch_size') == 200
+        assert config.get('performance.exiftool_pool_size') == 5
+
+    def test_custom_batch_size_is_kept(self, write_config):
+        """Test that a batch size other than the old default is left alone"""
+        write_config({'performance': {'batch_size': 50}})
+
+        assert ConfigManager().get('performance.batch_size') == 50
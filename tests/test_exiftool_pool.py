@@ -0,0 +1,82 @@
+"""
+Unit tests for ExifToolProcessPool batch reads.
+Uses mocked ExifToolProcess instances so no ExifTool installation is required.
+"""
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.exiftool_pool import ExifToolProcessPool
+
+
+def _make_pool(pool_size):
+    """Pool whose processes echo the requested paths back as metadata"""
+    calls = []
+    lock = threading.Lock()
+
+    def make_process():
+        process = MagicMock()
+
+        def read_batch(paths, tag_args=None):
+            with lock:
+                calls.append(list(paths))
+            return [{'SourceFile': path} for path in paths]
+
+        process.read_metadata_batch.side_effect = read_batch
+        return process
+
+    with patch('src.core.exiftool_process.ExifToolProcess', side_effect=make_process):
+        pool = ExifToolProcessPool(pool_size=pool_size)
+    return pool, calls
+
+
+class TestReadMetadataBatchParallel:
+    """Tests for sharding a batch across the pool"""
+
+    def test_one_shard_per_process(self):
+        """Test that a large batch is split into one contiguous shard per process"""
+        pool, calls = _make_pool(4)
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(200)]
+
+        results = pool.read_metadata_batch_parallel(files)
+
+        assert [result['SourceFile'] for result in results] == files
+        assert sorted(len(chunk) for chunk in calls) == [50, 50, 50, 50]
+        pool._shutdown = True
+
+    def test_small_batch_stays_on_one_process(self):
+        """Test that batches below chunk_size are not split"""
+        pool, calls = _make_pool(4)
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(7)]
+
+        results = pool.read_metadata_batch_parallel(files)
+
+        assert [result['SourceFile'] for result in results] == files
+        assert calls == [files]
+        pool._shutdown = True
+
+    def test_failed_shard_returns_empty_metadata(self):
+        """Test that a failing process leaves empty dicts for its shard only"""
+        pool, calls = _make_pool(2)
+        pool.processes[1].read_metadata_batch.side_effect = RuntimeError("exiftool died")
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(40)]
+
+        results = pool.read_metadata_batch_parallel(files)
+
+        assert len(results) == 40
+        assert sum(1 for result in results if result) == 20
+        pool._shutdown = True
+
+    def test_tag_args_forwarded_to_processes(self):
+        """Test that the requested tag set reaches every shard"""
+        pool, _ = _make_pool(2)
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(40)]
+
+        pool.read_metadata_batch_parallel(files, tag_args=('-fast2', '-make', '-model'))
+
+        for process in pool.processes:
+            assert process.read_metadata_batch.call_args[0][1] == ('-fast2', '-make', '-model')
+        pool._shutdown = True
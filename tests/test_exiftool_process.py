@@ -0,0 +1,113 @@
+"""
+Unit tests for ExifToolProcess locking and shutdown.
+The ExifTool subprocess is replaced by mocks so no installation is required.
+"""
+import os
+import json
+import sys
+import time
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.exiftool_process import ExifToolProcess
+
+
+@pytest.fixture
+def process():
+    """ExifToolProcess that looks started but has no real subprocess"""
+    proc = ExifToolProcess(executable_path='exiftool')
+    proc.running = True
+    proc.process = MagicMock()
+    proc.process.poll.return_value = None
+    yield proc
+    proc.running = False
+
+
+class TestLocking:
+    """Tests for restart/stop under the process lock"""
+
+    def test_failed_command_restarts_without_deadlock(self, process):
+        """Test that an error inside execute_command restarts while holding the lock"""
+        with patch.object(process, '_send_nolock', side_effect=TimeoutError("timed out")), \
+                patch.object(process, '_restart_nolock') as restart:
+            errors = []
+
+            def run():
+                try:
+                    process.execute_command(['-ver'])
+                except TimeoutError as e:
+                    errors.append(e)
+
+            worker = threading.Thread(target=run)
+            worker.start()
+            worker.join(timeout=5)
+
+            assert not worker.is_alive()
+            assert len(errors) == 1
+            restart.assert_called_once()
+
+    def test_stop_does_not_wait_for_busy_process(self, process):
+        """Test that stop() terminates the process when a command holds the lock"""
+        popen = process.process
+        process._lock.acquire()
+        try:
+            start = time.monotonic()
+            process.stop()
+            assert time.monotonic() - start < 5
+        finally:
+            process._lock.release()
+
+        popen.terminate.assert_called_once()
+        assert process._stop_requested
+
+    def test_stop_writes_shutdown_command(self, process):
+        """Test that an idle process is asked to exit through stdin"""
+        popen = process.process
+
+        process.stop()
+
+        popen.stdin.write.assert_called_once_with(b"-stay_open\nFalse\n")
+        assert not process.running
+        assert process.process is None
+
+
+class TestPipelinedCommands:
+    """Tests for sending several commands before reading the replies"""
+
+    def test_replies_split_across_one_chunk(self, process):
+        """Test that replies arriving together are returned one per command"""
+        chunks = [b"    1 image files updated\n{ready}\n    0 image files updated\n{re", b"ady}\n", None]
+        with patch.object(process, '_read_chunk', side_effect=chunks):
+            replies = process.execute_commands([['-CreateDate=x', 'a.jpg'], ['-CreateDate=x', 'b.jpg']])
+
+        assert replies == ["1 image files updated", "0 image files updated"]
+        written = process.process.stdin.write.call_args[0][0].decode('utf-8')
+        assert written.count("-execute\n") == 2
+        assert process._read_buffer == bytearray(b"\n")
+
+    def test_batch_update_reports_each_file(self, process):
+        """Test that a batch write returns the success of every file in order"""
+        with patch.object(process, 'execute_commands',
+                          return_value=["1 image files updated", "0 image files updated"]) as execute:
+            results = process.update_datetime_fields_batch([
+                ('/photos/a.jpg', {'CreateDate': datetime(2023, 5, 1, 12, 0, 0)}),
+                ('/photos/b.jpg', {'CreateDate': datetime(2023, 5, 1, 12, 0, 0)}),
+            ])
+
+        assert results == [True, False]
+        commands = execute.call_args[0][0]
+        assert commands[0][-2:] == ['-CreateDate=2023:05:01 12:00:00', '/photos/a.jpg']
+
+    def test_metadata_reply_is_parsed_from_bytes(self, process):
+        """Test that batch reads hand the undecoded reply to the JSON parser"""
+        chunks = [b'[{"SourceFile": "/photos/\xc3\xa6.jpg", "Make": "Canon"}]\n{ready}\n']
+        with patch.object(process, '_read_chunk', side_effect=chunks), \
+                patch('src.core.exiftool_process.json_loads', wraps=json.loads) as loads:
+            metadata = process.read_metadata_batch(['/photos/æ.jpg'])
+
+        assert metadata == [{"SourceFile": "/photos/æ.jpg", "Make": "Canon"}]
+        assert isinstance(loads.call_args[0][0], bytes)
@@ -0,0 +1,444 @@
+"""
+Unit tests for FileProcessor scanning and matching.
+Uses a mocked ExifHandler so no ExifTool installation is required.
+"""
+import logging
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+import tempfile
+import shutil
+from unittest.mock import MagicMock, patch
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.file_processor import FileProcessor, EMIT_BATCH_SIZE
+from src.core.camera_info_cache import CameraInfoCache
+from src.utils.exceptions import FileProcessingError
+
+
+def _fake_metadata(file_path):
+    """Files starting with 'CAN' are from a Canon camera, the rest have no camera info"""
+    if os.path.basename(file_path).startswith('CAN'):
+        return {'SourceFile': file_path, 'Make': 'Canon', 'Model': 'EOS R5'}
+    return {'SourceFile': file_path}
+
+
+@pytest.fixture
+def scan_directory():
+    """Directory with 150 camera-less photos, 30 Canon photos and one unsupported file"""
+    temp_dir = tempfile.mkdtemp(prefix='test_file_processor_')
+    for i in range(150):
+        Path(temp_dir, f'IMG_{i:04d}.jpg').touch()
+    for i in range(30):
+        Path(temp_dir, f'CAN_{i:04d}.jpg').touch()
+    Path(temp_dir, 'notes.txt').touch()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def file_processor():
+    """FileProcessor backed by a mocked ExifHandler"""
+    exif_handler = MagicMock()
+    exif_handler.get_camera_info.side_effect = lambda path: {
+        'make': _fake_metadata(path).get('Make', ''),
+        'model': _fake_metadata(path).get('Model', '')
+    }
+    exif_handler.read_camera_metadata_batch.side_effect = lambda paths: [_fake_metadata(p) for p in paths]
+    return FileProcessor(exif_handler)
+
+
+@pytest.fixture
+def offset_processor(file_processor):
+    """file_processor whose files all hold DateTimeOriginal and write successfully"""
+    handler = file_processor.exif_handler
+    handler.exiftool_pool.pool_size = 1
+    handler.read_metadata_batch.side_effect = lambda paths: [
+        {'DateTimeOriginal': '2023:05:01 12:00:00'} for _ in paths
+    ]
+    handler.update_datetime_fields_batch.side_effect = lambda updates: [True] * len(updates)
+    return file_processor
+
+
+def _collect(batch_signal):
+    """Flatten all paths emitted through a batch signal mock"""
+    return [path for call in batch_signal.emit.call_args_list for path in call[0][0]]
+
+
+def _scan(file_processor, reference, use_camera_match=True, use_extension_match=True,
+          use_pattern_match=False):
+    """Run an incremental scan and return the batch signal mock it emitted through"""
+    batch_signal = MagicMock()
+    file_processor.find_matching_files_incremental(
+        reference, use_camera_match=use_camera_match, use_extension_match=use_extension_match,
+        use_pattern_match=use_pattern_match, files_found_signal=batch_signal
+    )
+    return batch_signal
+
+
+def _use_cameraless_reference(file_processor):
+    """Make the reference file report no camera make or model"""
+    handler = file_processor.exif_handler
+    handler.get_camera_info.side_effect = None
+    handler.get_camera_info.return_value = {'make': '', 'model': ''}
+
+
+class TestFileFoundEmission:
+    """Tests for how matching files are reported to the UI"""
+
+    def test_batch_signal_coalesces_paths(self, file_processor, scan_directory):
+        """Test that matches are emitted in chunks through the batch signal"""
+        batch_signal = _scan(file_processor, os.path.join(scan_directory, 'IMG_0000.jpg'),
+                             use_camera_match=False)
+
+        assert len(_collect(batch_signal)) == 180
+        assert batch_signal.emit.call_count == 1
+
+    def test_camera_matches_use_small_chunks(self, file_processor, scan_directory):
+        """Test that camera matches are emitted in chunks of at most EMIT_BATCH_SIZE"""
+        _use_cameraless_reference(file_processor)
+
+        batch_signal = _scan(file_processor, os.path.join(scan_directory, 'IMG_0000.jpg'))
+
+        assert len(_collect(batch_signal)) == 150
+        assert all(len(call[0][0]) <= EMIT_BATCH_SIZE for call in batch_signal.emit.call_args_list)
+
+
+class TestCameraMatching:
+    """Tests for camera make/model filtering"""
+
+    def test_empty_reference_camera_matches_files_without_camera(self, file_processor, scan_directory):
+        """Test that a reference without camera info matches only files without camera info"""
+        _use_cameraless_reference(file_processor)
+
+        emitted = _collect(_scan(file_processor, os.path.join(scan_directory, 'IMG_0000.jpg')))
+
+        assert len(emitted) == 150
+        assert all(os.path.basename(path).startswith('IMG') for path in emitted)
+
+    def test_pattern_and_camera_filters_combine(self, file_processor, scan_directory):
+        """Test that pattern filtering runs before camera matching"""
+        batch_signal = _scan(file_processor, os.path.join(scan_directory, 'CAN_0003.jpg'),
+                             use_extension_match=False, use_pattern_match=True)
+
+        assert sorted(_collect(batch_signal)) == sorted(
+            os.path.join(scan_directory, f'CAN_{i:04d}.jpg') for i in range(30)
+        )
+
+    def test_metadata_batches_overlap(self, file_processor, scan_directory):
+        """Test that several metadata batches are read concurrently"""
+        lock = threading.Lock()
+        active = {'now': 0, 'max': 0}
+
+        def slow_read(paths):
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            time.sleep(0.05)
+            with lock:
+                active['now'] -= 1
+            return [_fake_metadata(p) for p in paths]
+
+        file_processor.exif_handler.read_camera_metadata_batch.side_effect = slow_read
+
+        batch_signal = _scan(file_processor, os.path.join(scan_directory, 'CAN_0000.jpg'))
+
+        assert len(_collect(batch_signal)) == 30
+        assert active['max'] > 1
+
+    def test_reference_camera_error_is_reported(self, file_processor, scan_directory):
+        """Test that a failing reference camera lookup still fails the scan"""
+        file_processor.exif_handler.get_camera_info.side_effect = RuntimeError("exiftool died")
+
+        with pytest.raises(FileProcessingError):
+            _scan(file_processor, os.path.join(scan_directory, 'CAN_0000.jpg'))
+
+    def test_formats_without_camera_tags_skip_exiftool(self, file_processor, scan_directory):
+        """Test that BMP files match a camera-less reference without being read"""
+        for i in range(5):
+            Path(scan_directory, f'SCAN_{i:04d}.bmp').touch()
+        _use_cameraless_reference(file_processor)
+        handler = file_processor.exif_handler
+
+        emitted = _collect(_scan(file_processor, os.path.join(scan_directory, 'IMG_0000.jpg'),
+                                 use_extension_match=False))
+        read = [path for call in handler.read_camera_metadata_batch.call_args_list for path in call[0][0]]
+        assert len(emitted) == 155
+        assert not any(path.endswith('.bmp') for path in read)
+
+    def test_camera_cache_skips_exiftool_on_rescan(self, file_processor, scan_directory):
+        """Test that a second scan answers unchanged files from the camera cache"""
+        file_processor.camera_cache = CameraInfoCache(os.path.join(scan_directory, 'cache.sqlite3'))
+        reference = os.path.join(scan_directory, 'CAN_0000.jpg')
+        handler = file_processor.exif_handler
+        results = []
+
+        for _ in range(2):
+            results.append(sorted(_collect(_scan(file_processor, reference))))
+            read_count = sum(len(call[0][0]) for call in handler.read_camera_metadata_batch.call_args_list)
+            handler.read_camera_metadata_batch.reset_mock()
+
+        assert results[0] == results[1]
+        assert len(results[1]) == 30
+        assert read_count == 0
+        file_processor.camera_cache.close()
+
+
+class TestEventLoopReuse:
+    """Tests for the shared scan event loop"""
+
+    def test_scans_reuse_one_loop_thread(self, file_processor, scan_directory):
+        """Test that repeated scans run on the same background loop"""
+        reference = os.path.join(scan_directory, 'IMG_0000.jpg')
+
+        for _ in range(3):
+            _scan(file_processor, reference, use_camera_match=False)
+            loop, thread = file_processor._loop, file_processor._loop_thread
+            assert loop.is_running()
+            assert thread.is_alive()
+
+        assert file_processor._get_event_loop() is loop
+
+    def test_shutdown_stops_loop_thread(self, file_processor, scan_directory):
+        """Test that shutdown stops and closes the background loop"""
+        _scan(file_processor, os.path.join(scan_directory, 'IMG_0000.jpg'), use_camera_match=False)
+        loop, thread = file_processor._loop, file_processor._loop_thread
+
+        file_processor.shutdown()
+
+        assert not thread.is_alive()
+        assert loop.is_closed()
+        assert file_processor._loop is None
+
+
+class TestDirectoryStreaming:
+    """Tests for chunked directory scanning"""
+
+    def test_iter_directory_yields_bounded_chunks(self, file_processor, scan_directory):
+        """Test that the scan streams (name, path) chunks covering all supported files"""
+        async def collect():
+            return [
+                chunk async for chunk in
+                file_processor.concurrent_processor.iter_directory(scan_directory, {'.jpg'}, chunk_size=50)
+            ]
+
+        chunks = asyncio.run(collect())
+
+        assert [len(chunk) for chunk in chunks] == [50, 50, 50, 30]
+        names = {name for chunk in chunks for name, _ in chunk}
+        assert len(names) == 180
+        assert all(path == os.path.join(scan_directory, name) for chunk in chunks for name, path in chunk)
+
+    def test_signatures_come_from_scan(self, file_processor, scan_directory):
+        """Test that the scan records (mtime, size) for every yielded file"""
+        signatures = {}
+
+        async def collect():
+            return [
+                path async for chunk in
+                file_processor.concurrent_processor.iter_directory(scan_directory, {'.jpg'}, signatures=signatures)
+                for _, path in chunk
+            ]
+
+        paths = asyncio.run(collect())
+
+        assert set(signatures) == set(paths)
+        stat = os.stat(paths[0])
+        assert signatures[paths[0]] == (stat.st_mtime_ns, stat.st_size)
+
+    def test_unstattable_entry_is_skipped(self, file_processor, scan_directory):
+        """Test that an entry whose type check fails doesn't end the scan early"""
+        real_entries = sorted(os.scandir(scan_directory), key=lambda entry: entry.name)
+        broken = MagicMock()
+        broken.name = 'BROKEN.jpg'
+        broken.is_file.side_effect = PermissionError("denied")
+
+        class FakeScandir:
+            # Single pass, like the real ScandirIterator
+            def __init__(self, entries):
+                self._entries = iter(entries)
+
+            def __iter__(self):
+                return self._entries
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        async def collect():
+            return [
+                name async for chunk in
+                file_processor.concurrent_processor.iter_directory(scan_directory, {'.jpg'}, chunk_size=1)
+                for name, _ in chunk
+            ]
+
+        with patch('src.core.concurrent_file_processor.os.scandir', return_value=FakeScandir([broken] + real_entries)):
+            names = asyncio.run(collect())
+
+        assert len(names) == 180
+        assert 'BROKEN.jpg' not in names
+
+    def test_missing_directory_yields_nothing(self, file_processor):
+        """Test that an unreadable directory ends the stream instead of raising"""
+        async def collect():
+            return [
+                chunk async for chunk in
+                file_processor.concurrent_processor.iter_directory('/nonexistent/folder', {'.jpg'})
+            ]
+
+        assert asyncio.run(collect()) == []
+
+
+class TestApplyTimeOffset:
+    """Tests for group-based offset application"""
+
+    def test_updates_run_in_parallel_across_pool(self, offset_processor):
+        """Test that files in a group are written concurrently and all results are returned"""
+        handler = offset_processor.exif_handler
+        handler.exiftool_pool.pool_size = 3
+        lock = threading.Lock()
+        active = {'now': 0, 'max': 0}
+
+        def slow_update(updates):
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            time.sleep(0.05)
+            with lock:
+                active['now'] -= 1
+            return [True] * len(updates)
+
+        handler.update_datetime_fields_batch.side_effect = slow_update
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(30)]
+
+        results = offset_processor.apply_time_offset(files, 'DateTimeOriginal', 60)
+
+        assert list(results) == files
+        assert all(results.values())
+        assert 1 < active['max'] <= 3
+        batches = [call[0][0] for call in handler.update_datetime_fields_batch.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [10, 10, 10]
+        handler.update_all_datetime_fields.assert_not_called()
+
+    def test_retry_only_failed_files(self, offset_processor):
+        """Test that a retry re-processes just the files that failed"""
+        handler = offset_processor.exif_handler
+        handler.exiftool_pool.pool_size = 2
+        attempts = {}
+
+        def flaky_update(updates):
+            results = []
+            for path, fields in updates:
+                attempts[path] = attempts.get(path, 0) + 1
+                results.append(not (path.endswith('0003.jpg') and attempts[path] == 1))
+            return results
+
+        handler.update_datetime_fields_batch.side_effect = flaky_update
+        files = [f'/photos/IMG_{i:04d}.jpg' for i in range(10)]
+
+        results = offset_processor.apply_time_offset(files, 'DateTimeOriginal', 0)
+
+        assert all(results.values())
+        assert list(results) == files
+        assert attempts['/photos/IMG_0003.jpg'] == 2
+        assert sum(attempts.values()) == 11
+        assert handler.read_metadata_batch.call_args_list[-1][0][0] == ['/photos/IMG_0003.jpg']
+        handler.exiftool_pool.restart_pool.assert_not_called()
+
+    def test_retry_restarts_unhealthy_pool(self, offset_processor):
+        """Test that the pool is restarted before a retry only when a process is down"""
+        handler = offset_processor.exif_handler
+        handler.exiftool_pool.is_healthy.return_value = False
+        handler.update_datetime_fields_batch.side_effect = [[True, False], [True]]
+
+        results = offset_processor.apply_time_offset(
+            ['/photos/IMG_0001.jpg', '/photos/IMG_0002.jpg'], 'DateTimeOriginal', 0)
+
+        assert all(results.values())
+        handler.exiftool_pool.restart_pool.assert_called_once()
+
+    def test_missing_field_is_not_retried(self, offset_processor):
+        """Test that files lacking the selected field fail without a retry or pool restart"""
+        handler = offset_processor.exif_handler
+        handler.exiftool_pool.is_healthy.return_value = False
+        handler.read_metadata_batch.side_effect = lambda paths: [
+            {'DateTimeOriginal': '2023:05:01 12:00:00'} if path.endswith('1.jpg') else {}
+            for path in paths
+        ]
+
+        results = offset_processor.apply_time_offset(
+            ['/photos/IMG_0001.jpg', '/photos/IMG_0002.jpg'], 'DateTimeOriginal', 0)
+
+        assert results == {'/photos/IMG_0001.jpg': True, '/photos/IMG_0002.jpg': False}
+        handler.read_metadata_batch.assert_called_once()
+        handler.exiftool_pool.restart_pool.assert_not_called()
+
+
+class TestSingleFileUpdate:
+    """Tests for the datetime fields written for one file"""
+
+    def test_all_parsed_and_mandatory_fields_get_adjusted_time(self, file_processor):
+        """Test that existing datetime fields and missing mandatory fields share the new timestamp"""
+        file_processor.exif_handler.update_all_datetime_fields.return_value = True
+        metadata = {
+            'SourceFile': '/photos/IMG_0001.jpg',
+            'DateTimeOriginal': '2023:05:01 12:00:00',
+            'GPSDateStamp': '',
+            'SubSecTimeOriginal': 'not a date',
+            'Make': 'Canon'
+        }
+
+        assert file_processor._process_single_file(
+            '/photos/IMG_0001.jpg', metadata, 'DateTimeOriginal', 90
+        )
+
+        fields = file_processor.exif_handler.update_all_datetime_fields.call_args[0][1]
+        assert set(fields) == {
+            'DateTimeOriginal', 'CreateDate', 'ModifyDate', 'FileCreateDate', 'FileModifyDate'
+        }
+        assert set(fields.values()) == {datetime(2023, 5, 1, 12, 1, 30)}
+
+    def test_added_mandatory_fields_are_logged_by_file_name(self, file_processor, caplog):
+        """Test that a successful write reports the added mandatory fields with the file's basename"""
+        file_processor.exif_handler.update_all_datetime_fields.return_value = True
+        metadata = {'DateTimeOriginal': '2023:05:01 12:00:00'}
+
+        with caplog.at_level(logging.INFO, logger='src.core.file_processor'):
+            assert file_processor._process_single_file(
+                '/photos/IMG_0001.jpg', metadata, 'DateTimeOriginal', 0
+            )
+
+        assert "mandatory fields added) in IMG_0001.jpg" in caplog.text
+        assert '/photos/' not in caplog.text
+
+    def test_debug_only_logging_skips_basename(self, file_processor, caplog):
+        """Test that a plain success computes no basename while DEBUG logging is off"""
+        with caplog.at_level(logging.INFO, logger='src.core.file_processor'), \
+                patch('src.core.file_processor.os.path.basename') as basename:
+            file_processor._log_update_success(
+                '/photos/IMG_0001.jpg', {'DateTimeOriginal': datetime(2023, 5, 1)}, [])
+
+        basename.assert_not_called()
+
+        with caplog.at_level(logging.DEBUG, logger='src.core.file_processor'):
+            file_processor._log_update_success(
+                '/photos/IMG_0001.jpg', {'DateTimeOriginal': datetime(2023, 5, 1)}, [])
+
+        assert "Updated 1 fields in IMG_0001.jpg" in caplog.text
+
+    def test_missing_selected_field_skips_update(self, file_processor):
+        """Test that a file without the selected field is reported as failed"""
+        metadata = {'CreateDate': '2023:05:01 12:00:00'}
+
+        assert not file_processor._process_single_file(
+            '/photos/IMG_0001.jpg', metadata, 'DateTimeOriginal', 0
+        )
+        file_processor.exif_handler.update_all_datetime_fields.assert_not_called()
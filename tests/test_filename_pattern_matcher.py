@@ -9,7 +9,7 @@ import pytest
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.filename_pattern import FilenamePatternMatcher
+from src.core.filename_pattern import FilenamePatternMatcher, PATTERNS, _strip_extension
 
 
 class TestPrefixSeparatorNumberPattern:
@@ -430,6 +430,13 @@ class TestEdgeCases:
         result = FilenamePatternMatcher.extract_pattern("IMG_1234")
         assert result['type'] == 'prefix_separator_number'
 
+    @pytest.mark.parametrize("filename", [
+        "IMG_0001.jpg", "a.b.jpg", "noext", ".bashrc", "..jpg", "...", "name.", ".hidden.jpg", ""
+    ])
+    def test_strip_extension_matches_splitext(self, filename):
+        """Test that the extension is stripped exactly as os.path.splitext would"""
+        assert _strip_extension(filename) == os.path.splitext(filename)[0]
+
     def test_extract_multiple_extensions(self):
         """Test extracting with multiple extensions"""
         result = FilenamePatternMatcher.extract_pattern("IMG_1234.backup.jpg")
@@ -611,6 +618,23 @@ class TestPatternAttributes:
         result = FilenamePatternMatcher.extract_pattern("IMG_0001.jpg")
         assert 'pattern' in result
 
+    def test_pattern_field_is_compiled(self):
+        """Test that the pattern field holds the compiled regex, shared across calls"""
+        first = FilenamePatternMatcher.extract_pattern("IMG_0001.jpg")
+        second = FilenamePatternMatcher.extract_pattern("DSC_0002.jpg")
+        assert first['pattern'].match("IMG_0003")
+        assert first['pattern'] is second['pattern']
+
+    def test_repeated_extraction_is_memoized(self):
+        """Test that a repeated stem hits the cache but still gets its own result dict"""
+        FilenamePatternMatcher.clear_cache()
+        first = FilenamePatternMatcher.extract_pattern("IMG_0001.jpg")
+        second = FilenamePatternMatcher.extract_pattern("IMG_0001.cr2")
+
+        assert first == second
+        assert first is not second
+        assert FilenamePatternMatcher._classify_stem.cache_info().hits == 1
+
     def test_no_pattern_has_correct_structure(self):
         """Test that no_pattern results have correct structure"""
         result = FilenamePatternMatcher.extract_pattern("random_text.jpg")
@@ -619,6 +643,52 @@ class TestPatternAttributes:
         assert isinstance(result['groups'], list)
 
 
+class TestCompiledPattern:
+    """Tests for FilenamePatternMatcher.compile"""
+
+    FILENAMES = [
+        "IMG_0001.jpg", "IMG-0002.jpg", "IMGX_0001.jpg", "DSC0001.jpg",
+        "20230101_120000.jpg", "Screenshot_20230101-120000_App.png",
+        "VID_0001.mp4", "MOV_0001.mov", "VIDEO_20230101_120000.mp4",
+        "GOPR0001.mp4", "GH010001.mp4", "DJI_0001.mp4", "abc123def.jpg",
+        "bilde_ø_001.jpg", "random_text.jpg", "random_text_2.jpg", "a.b.jpg"
+    ]
+
+    @pytest.mark.parametrize("reference", FILENAMES)
+    def test_compiled_regex_agrees_with_matches_pattern(self, reference):
+        """Test that the compiled regex gives the same result as matches_pattern"""
+        pattern = FilenamePatternMatcher.extract_pattern(reference)
+        matcher = FilenamePatternMatcher.compile(pattern)
+
+        for filename in self.FILENAMES:
+            expected = FilenamePatternMatcher.matches_pattern(filename, pattern)
+            assert bool(matcher.match(os.path.splitext(filename)[0])) == expected, filename
+
+    @pytest.mark.parametrize("filename", FILENAMES + [
+        "Screencast_2023-01-01_12-00-00.mp4", "2023-01-01 12-00-00.mp4",
+        "Photo 01-01-2023, 12 00 00.jpg", "GX010001.mp4", "VID_20230101_120000.mp4"
+    ])
+    def test_extract_agrees_with_sequential_patterns(self, filename):
+        """Test that the combined regex picks the same type and groups as trying each pattern in order"""
+        stem = os.path.splitext(filename)[0]
+        expected = next(((pattern_type, match.groups()) for pattern, pattern_type in PATTERNS
+                         for match in [pattern.match(stem)] if match), None)
+
+        result = FilenamePatternMatcher.extract_pattern(filename)
+        if expected is None:
+            assert result['type'] == 'no_pattern'
+        else:
+            assert (result['type'], result['groups']) == expected
+
+    def test_compiled_prefix_is_escaped(self):
+        """Test that regex characters in a no_pattern prefix are matched literally"""
+        pattern = FilenamePatternMatcher.extract_pattern("my+photo.jpg")
+        matcher = FilenamePatternMatcher.compile(pattern)
+        assert pattern['type'] == 'no_pattern'
+        assert matcher.match("my+photo_edited")
+        assert not matcher.match("myyphoto")
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])
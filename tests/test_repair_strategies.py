@@ -0,0 +1,311 @@
+"""
+Unit tests for FileRepairer's strategy loop.
+Repair and verification steps are replaced by mocks so no ExifTool installation is required.
+"""
+import os
+import sys
+import shutil
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.repair_strategies import FileRepairer, RepairStrategy
+from src.core.corruption_detector import CorruptionType
+
+
+@pytest.fixture
+def photo(tmp_path):
+    """Small file standing in for a corrupted photo"""
+    file_path = tmp_path / "IMG_0001.jpg"
+    file_path.write_bytes(b"original bytes")
+    return str(file_path)
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return str(tmp_path / "backups")
+
+
+class TestBackupRestore:
+    """Tests for restoring the backup between strategy attempts"""
+
+    def test_first_attempt_does_not_restore(self, photo, backup_dir):
+        """Test that the untouched original isn't copied back before the first strategy"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(True, "")), \
+                patch.object(repairer, '_verify_repair', return_value=True):
+            backup_path = repairer._create_backup(photo, backup_dir)
+            with patch.object(repairer, '_create_backup', return_value=backup_path), \
+                    patch('src.core.repair_strategies.shutil.copy2', wraps=shutil.copy2) as copy2:
+                result = repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir)
+
+        assert result.success
+        assert result.strategy_used == RepairStrategy.SAFEST
+        copy2.assert_not_called()
+
+    def test_failed_attempts_restore_before_next_strategy(self, photo, backup_dir):
+        """Test that each strategy after a failed write starts from the backup"""
+        repairer = FileRepairer()
+        seen = []
+
+        def apply(file_path, strategy):
+            with open(file_path, 'rb') as f:
+                seen.append(f.read())
+            if strategy != RepairStrategy.FILESYSTEM_ONLY:
+                # Like ExifTool's -overwrite_original: write a new file, rename it over
+                with open(file_path + '.tmp', 'wb') as f:
+                    f.write(b"damaged by " + strategy.value.encode())
+                os.replace(file_path + '.tmp', file_path)
+            return False, "failed"
+
+        with patch.object(repairer, '_apply_single_step_repair', side_effect=apply):
+            result = repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir)
+
+        assert not result.success
+        # SAFEST, AGGRESSIVE and FILESYSTEM_ONLY; THOROUGH would repeat SAFEST's write
+        assert seen == [b"original bytes"] * 3
+        with open(photo, 'rb') as f:
+            assert f.read() == b"original bytes"
+
+    def test_backup_is_linked_and_survives_rewrite(self, photo, backup_dir):
+        """Test that the hard-linked backup keeps the original after a write-and-rename"""
+        repairer = FileRepairer()
+        backup_path = repairer._create_backup(photo, backup_dir)
+        assert os.path.samefile(photo, backup_path)
+
+        with open(photo + '.tmp', 'wb') as f:
+            f.write(b"rewritten")
+        os.replace(photo + '.tmp', photo)
+
+        with open(backup_path, 'rb') as f:
+            assert f.read() == b"original bytes"
+
+    def test_failed_write_without_rename_skips_restore(self, photo, backup_dir):
+        """Test that a file still linked to its backup isn't copied onto itself"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(False, "failed")) as apply:
+            result = repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir)
+
+        assert not result.success
+        # Every automatic strategy was attempted, none was lost to a failed restore
+        assert apply.call_count == 3
+        with open(photo, 'rb') as f:
+            assert f.read() == b"original bytes"
+
+    def test_filesystem_only_failure_skips_final_restore(self, photo, backup_dir):
+        """Test that no restore follows a strategy that leaves the file untouched"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_verify_repair', return_value=False):
+            backup_path = repairer._create_backup(photo, backup_dir)
+            with patch.object(repairer, '_create_backup', return_value=backup_path), \
+                    patch('src.core.repair_strategies.shutil.copy2', wraps=shutil.copy2) as copy2:
+                result = repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir,
+                                              force_strategy=True,
+                                              selected_strategy=RepairStrategy.FILESYSTEM_ONLY)
+
+        assert result.success
+        assert not result.verification_passed
+        copy2.assert_not_called()
+
+
+class TestStrategyOrder:
+    """Tests for the automatic strategy progression"""
+
+    def test_thorough_is_skipped_after_safest(self, photo, backup_dir):
+        """Test that the automatic order doesn't repeat SAFEST's write as THOROUGH"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(False, "failed")) as apply:
+            repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir)
+
+        tried = [call.args[1] for call in apply.call_args_list]
+        assert tried == [RepairStrategy.SAFEST, RepairStrategy.AGGRESSIVE, RepairStrategy.FILESYSTEM_ONLY]
+
+    def test_file_without_exif_tries_untouched_first(self, photo, backup_dir):
+        """Test that a file without EXIF that is already writable gets no ExifTool write"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_run_exiftool') as run_exiftool, \
+                patch.object(repairer, '_verify_repair', return_value=True):
+            result = repairer.repair_file(photo, CorruptionType.FILESYSTEM_ONLY, backup_dir)
+
+        assert result.success
+        assert result.strategy_used == RepairStrategy.FILESYSTEM_ONLY
+        run_exiftool.assert_not_called()
+
+    def test_file_without_exif_falls_back_to_aggressive(self, photo, backup_dir):
+        """Test that only AGGRESSIVE follows when the untouched file isn't writable"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(True, "")) as apply, \
+                patch.object(repairer, '_verify_repair', side_effect=[False, True]):
+            result = repairer.repair_file(photo, CorruptionType.FILESYSTEM_ONLY, backup_dir)
+
+        assert result.strategy_used == RepairStrategy.AGGRESSIVE
+        tried = [call.args[1] for call in apply.call_args_list]
+        assert tried == [RepairStrategy.FILESYSTEM_ONLY, RepairStrategy.AGGRESSIVE]
+
+    def test_thorough_can_still_be_forced(self, photo, backup_dir):
+        """Test that a user-selected THOROUGH repair still runs"""
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(True, "")) as apply, \
+                patch.object(repairer, '_verify_repair', return_value=True):
+            result = repairer.repair_file(photo, CorruptionType.EXIF_STRUCTURE, backup_dir,
+                                          force_strategy=True, selected_strategy=RepairStrategy.THOROUGH)
+
+        assert result.strategy_used == RepairStrategy.THOROUGH
+        apply.assert_called_once_with(photo, RepairStrategy.THOROUGH)
+
+
+class TestPersistentExifTool:
+    """Tests for running repair steps on one -stay_open ExifTool process"""
+
+    def test_steps_share_one_process(self, photo):
+        """Test that repair and verification commands reuse a single started process"""
+        repairer = FileRepairer()
+        with patch('src.core.repair_strategies.ExifToolProcess') as MockProcess:
+            process = MockProcess.return_value
+            process.execute_command.return_value = "    1 image files updated\n"
+            assert repairer._apply_single_step_repair(photo, RepairStrategy.SAFEST)[0]
+            assert repairer._apply_single_step_repair(photo, RepairStrategy.AGGRESSIVE)[0]
+
+            process.execute_command.return_value = "    1 image files created\n"
+            assert repairer._verify_repair(photo)
+
+        MockProcess.assert_called_once_with("exiftool")
+        process.start.assert_called_once()
+        assert process.execute_command.call_count == 4
+        # The path is sent inline as the last argument
+        assert all(call.args[0][-1] == photo for call in process.execute_command.call_args_list)
+
+    def test_verification_writes_scratch_copy(self, photo):
+        """Test that verification writes to a separate output and leaves the file alone"""
+        repairer = FileRepairer()
+        with patch('src.core.repair_strategies.ExifToolProcess') as MockProcess:
+            MockProcess.return_value.execute_command.return_value = "    1 image files created\n"
+
+            assert repairer._verify_repair(photo)
+
+        args = MockProcess.return_value.execute_command.call_args.args[0]
+        output_path = args[args.index('-o') + 1]
+        assert output_path != photo
+        assert output_path.endswith('.jpg')
+        assert '-overwrite_original' not in args
+        with open(photo, 'rb') as f:
+            assert f.read() == b"original bytes"
+
+    def test_failed_write_is_reported(self, photo):
+        """Test that a write ExifTool reports as failed is not treated as a repair"""
+        repairer = FileRepairer()
+        with patch('src.core.repair_strategies.ExifToolProcess') as MockProcess:
+            MockProcess.return_value.execute_command.return_value = (
+                "    0 image files updated\n    1 files weren't updated due to errors\n")
+
+            success, message = repairer._apply_single_step_repair(photo, RepairStrategy.THOROUGH)
+
+        assert not success
+        assert "weren't updated" in message
+
+    @pytest.mark.parametrize("output, succeeded", [
+        ("    1 image files updated\n", True),
+        ("    0 image files updated\n    1 image files unchanged\n", True),
+        ("    0 image files updated\n    1 files weren't updated due to errors\n", False),
+        ("    1 files could not be read\n", False),
+        ("", False),
+    ])
+    def test_summary_parsing(self, output, succeeded):
+        """Test that write success is read from ExifTool's summary counts"""
+        counts = FileRepairer._summary_counts(output)
+        assert FileRepairer._command_succeeded(counts) == succeeded
+
+    def test_close_stops_process(self, photo):
+        """Test that close() stops the process and a later step starts a new one"""
+        repairer = FileRepairer()
+        with patch('src.core.repair_strategies.ExifToolProcess') as MockProcess:
+            MockProcess.return_value.execute_command.return_value = "    1 image files updated\n"
+            repairer._apply_single_step_repair(photo, RepairStrategy.SAFEST)
+            repairer.close()
+            MockProcess.return_value.stop.assert_called_once()
+
+            repairer._apply_single_step_repair(photo, RepairStrategy.SAFEST)
+
+        assert MockProcess.call_count == 2
+
+
+class TestParallelRepair:
+    """Tests for FileRepairer.repair_files"""
+
+    def test_same_named_files_get_separate_backups(self, tmp_path, backup_dir):
+        """Test that parallel repairs of equally named files never share a backup"""
+        files = []
+        for i in range(8):
+            folder = tmp_path / f"folder_{i}"
+            folder.mkdir()
+            file_path = folder / "IMG_0001.jpg"
+            file_path.write_bytes(f"photo {i}".encode())
+            files.append(str(file_path))
+
+        repairer = FileRepairer()
+        with patch.object(repairer, '_apply_single_step_repair', return_value=(True, "")), \
+                patch.object(repairer, '_verify_repair', return_value=True):
+            results = dict(repairer.repair_files(
+                [(file_path, CorruptionType.EXIF_STRUCTURE) for file_path in files], backup_dir))
+
+        assert set(results) == set(files)
+        backups = {result.backup_path for result in results.values()}
+        assert len(backups) == len(files)
+        for file_path, result in results.items():
+            with open(result.backup_path, 'rb') as backup, open(file_path, 'rb') as original:
+                assert backup.read() == original.read()
+
+    def test_exception_becomes_failed_result(self, photo, backup_dir):
+        """Test that an unexpected error in one repair is reported as that file's failure"""
+        repairer = FileRepairer()
+        with patch.object(repairer, 'repair_file', side_effect=RuntimeError("boom")):
+            results = list(repairer.repair_files([(photo, CorruptionType.MAKERNOTES)], backup_dir))
+
+        assert len(results) == 1
+        file_path, result = results[0]
+        assert file_path == photo
+        assert not result.success
+        assert result.error_message == "boom"
+
+    def test_each_worker_thread_has_own_process(self, tmp_path, backup_dir):
+        """Test that worker threads don't share an ExifTool process and close() stops them all"""
+        files = []
+        for i in range(4):
+            file_path = tmp_path / f"IMG_{i:04d}.jpg"
+            file_path.write_bytes(b"photo")
+            files.append(str(file_path))
+
+        repairer = FileRepairer()
+        processes = []
+
+        def start_process(executable_path):
+            process = MagicMock()
+            process.execute_command.return_value = "    1 image files updated\n"
+            processes.append(process)
+            return process
+
+        with patch('src.core.repair_strategies.ExifToolProcess', side_effect=start_process):
+            list(repairer.repair_files(
+                [(file_path, CorruptionType.EXIF_STRUCTURE) for file_path in files], backup_dir,
+                max_workers=2))
+            repairer.close()
+
+        assert 1 <= len(processes) <= 2
+        for process in processes:
+            process.stop.assert_called_once()
+
+    def test_alignment_closes_repairer_when_progress_raises(self, photo):
+        """Test that the repairer's processes are stopped even if reporting progress fails"""
+        from src.core.alignment_processor import AlignmentProcessor
+
+        processor = AlignmentProcessor(MagicMock(), MagicMock())
+        corruption = MagicMock(corruption_type=CorruptionType.MAKERNOTES, is_repairable=True)
+        progress = MagicMock(side_effect=[None, RuntimeError("UI gone")])
+
+        with patch.object(processor.file_repairer, 'repair_file', return_value=MagicMock()), \
+                patch.object(processor.file_repairer, 'close') as close:
+            with pytest.raises(RuntimeError):
+                processor._repair_corrupted_files({photo: corruption}, [photo], progress)
+
+        close.assert_called_once()
@@ -161,6 +161,16 @@ class TestParseDatetimeNaive:
         # Only 14-digit compact format (YYYYMMDDHHMMSS) is parsed successfully
         assert result is None
 
+    def test_parse_exif_format_with_surrounding_whitespace(self):
+        """Test that padded EXIF timestamps parse like unpadded ones"""
+        result = TimeCalculator.parse_datetime_naive(" 2023:12:25 14:30:45 ")
+        assert result == datetime(2023, 12, 25, 14, 30, 45)
+
+    def test_parse_zero_exif_date(self):
+        """Test that the all-zero EXIF placeholder date returns None"""
+        result = TimeCalculator.parse_datetime_naive("0000:00:00 00:00:00")
+        assert result is None
+
     def test_parse_milliseconds_truncation(self):
         """Test that milliseconds beyond 6 digits are truncated"""
         result = TimeCalculator.parse_datetime_naive("2023-12-25T14:30:45.123456789")
@@ -169,6 +179,29 @@ class TestParseDatetimeNaive:
         assert result.microsecond == 123456
 
 
+class TestCachedHelpers:
+    """Tests for the memoized parsing helpers"""
+
+    def test_parse_datetime_cached_matches_uncached(self):
+        """Test that the cached parser returns the same result as parse_datetime_naive"""
+        for value in ["2023:12:25 14:30:45", "2023-12-25T14:30:45+02:00", "not a date", ""]:
+            assert TimeCalculator.parse_datetime_cached(value) == TimeCalculator.parse_datetime_naive(value)
+
+    def test_parse_datetime_cached_reuses_result(self):
+        """Test that a repeated value is served from the cache"""
+        TimeCalculator.parse_datetime_cached.cache_clear()
+        TimeCalculator.parse_datetime_cached("2023:12:25 14:30:45")
+        TimeCalculator.parse_datetime_cached("2023:12:25 14:30:45")
+        assert TimeCalculator.parse_datetime_cached.cache_info().hits == 1
+
+    def test_is_datetime_field(self):
+        """Test date/time tag name detection"""
+        assert TimeCalculator.is_datetime_field("DateTimeOriginal")
+        assert TimeCalculator.is_datetime_field("FileModifyDate")
+        assert TimeCalculator.is_datetime_field("SubSecTime")
+        assert not TimeCalculator.is_datetime_field("Make")
+
+
 class TestNorwegianDateFormats:
     """Tests for Norwegian date formats and characters"""
 
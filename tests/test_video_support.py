@@ -189,6 +189,38 @@ class TestVideoMetadataCapability:
         assert isinstance(result, dict), "Should return dict even for missing files"
 
 
+class TestCameraTagReading:
+    """Tests for how much of each video ExifTool reads for camera matching"""
+
+    def test_quicktime_containers_are_supported_formats(self):
+        """Test that every QuickTime-based extension is also a supported format"""
+        from src.core.supported_formats import ALL_SUPPORTED_EXTENSIONS, QUICKTIME_BASED_EXTENSIONS
+
+        assert QUICKTIME_BASED_EXTENSIONS <= ALL_SUPPORTED_EXTENSIONS
+
+    @pytest.mark.parametrize('filename', ['clip.f4v', 'clip.MP4', 'IMG_0001.heic'])
+    def test_quicktime_containers_skip_fast2(self, filename):
+        """Test that QuickTime-based files are read without -fast2, which stops at the media data"""
+        from src.core.exif_handler import ExifHandler
+        from src.core.exiftool_process import CAMERA_TAG_ARGS, SAFE_CAMERA_TAG_ARGS
+
+        exif_handler = ExifHandler.__new__(ExifHandler)
+        exif_handler.exiftool_pool = MagicMock()
+        exif_handler.exiftool_pool.read_metadata_batch_parallel.side_effect = \
+            lambda paths, tag_args: [{'SourceFile': path} for path in paths]
+
+        exif_handler.read_camera_metadata_batch(['/videos/' + filename, '/photos/IMG_0002.jpg'])
+
+        calls = {
+            call[1]['tag_args']: call[0][0]
+            for call in exif_handler.exiftool_pool.read_metadata_batch_parallel.call_args_list
+        }
+        assert calls == {
+            SAFE_CAMERA_TAG_ARGS: ['/videos/' + filename],
+            CAMERA_TAG_ARGS: ['/photos/IMG_0002.jpg']
+        }
+
+
 class TestFileProcessorExtensions:
     """Tests for FileProcessor supported extensions"""
 